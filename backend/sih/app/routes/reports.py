@@ -10,7 +10,7 @@ from app.schemas import CreateReportRequest, VoiceReportRequest, UpdateReportSta
 from app.database import get_database
 from app.utils.auth import get_current_user, get_current_user_or_guest, require_official
 from app.utils.storage import generate_media_urls
-from app.utils.gemini import process_voice_with_images
+from app.utils.gemini import process_voice_with_images, UnsupportedAudioError
 from app.config import get_settings
 
 settings = get_settings()
@@ -113,15 +113,18 @@ async def create_voice_report(
         raise HTTPException(status_code=401, detail="Authentication required")
     
     try:
-        # Download audio file from GCS to process with Gemini
-        from app.utils.storage import get_gcs_client
-        from app.utils.gemini import process_voice_with_images
+        # Audio stays in GCS and is streamed to Gemini
+        from app.utils.storage import get_gcs_client, iter_blob_chunks
+        from app.utils.gemini import process_voice_with_images, MAX_AUDIO_BYTES
         
-        # Get GCS client and download audio bytes
+        # Look up the audio blob; it is streamed to Gemini rather than downloaded whole
         client = get_gcs_client()
         bucket = client.bucket(settings.GOOGLE_CLOUD_BUCKET_NAME)
-        blob = bucket.blob(request.audio.fileName)
-        audio_bytes = blob.download_as_bytes()
+        blob = bucket.get_blob(request.audio.fileName)
+        if blob is None:
+            raise HTTPException(status_code=404, detail="Audio file not found")
+        if blob.size > MAX_AUDIO_BYTES:
+            raise HTTPException(status_code=413, detail="Audio file is too large")
         
         # Process audio through Gemini AI with context
         context = {
@@ -131,11 +134,16 @@ async def create_voice_report(
         }
         
         # Extract structured data from voice note
-        image_urls = [img.url for img in request.images] if request.images else []
+        # Bucket is private, so hand Gemini signed URLs it can actually fetch
+        image_urls = [
+            item["url"] for item in generate_media_urls([img.dict() for img in request.images])
+        ] if request.images else []
         extracted_data = await process_voice_with_images(
-            audio_file_data=audio_bytes,
+            audio_stream=iter_blob_chunks(blob),
+            size_hint=blob.size,
             image_urls=image_urls,
-            location=request.location.dict() if request.location else None
+            location=request.location.dict() if request.location else None,
+            transcript=request.transcript
         )
         
         # Calculate priority based on extracted severity
@@ -199,6 +207,10 @@ async def create_voice_report(
             }
         }
         
+    except HTTPException:
+        raise
+    except UnsupportedAudioError as e:
+        raise HTTPException(status_code=415, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process voice report: {str(e)}")
 
@@ -9,8 +9,7 @@ from app.utils.auth import get_current_user_or_guest
 from app.utils.storage import (
     generate_signed_upload_url,
     generate_signed_download_url,
-    validate_file_type,
-    get_content_type
+    classify_file
 )
 
 router = APIRouter()
@@ -19,6 +18,7 @@ router = APIRouter()
 class SignedUrlRequest(BaseModel):
     fileName: str
     contentType: str
+    resumable: bool = False
 
 
 class RefreshUrlsRequest(BaseModel):
@@ -37,7 +37,7 @@ async def get_signed_upload_url(
         raise HTTPException(status_code=401, detail="Authentication required")
     
     # Validate file type
-    is_valid, error = validate_file_type(request.fileName)
+    is_valid, _, error = classify_file(request.fileName)
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
     
@@ -45,7 +45,8 @@ async def get_signed_upload_url(
         result = generate_signed_upload_url(
             request.fileName,
             request.contentType,
-            expires_in=3600
+            expires_in=3600,
+            resumable=request.resumable
         )
         return result
     except Exception as e:
@@ -169,6 +169,42 @@ class VoiceReportRequest(BaseModel):
     address: Optional[str] = Field(None, max_length=500)
     landmark: Optional[str] = Field(None, max_length=200)
     emergencyContact: Optional[EmergencyContactSchema] = None
+    transcript: Optional[str] = Field(None, max_length=5000, description="Optional on-device transcript, used to detect duplicate reports")
+
+
+class GeminiReportExtraction(BaseModel):
+    """Structured fields Gemini extracts from a voice note"""
+    title: str = "Voice Report"
+    description: str = ""
+    hazardType: Literal[
+        "flood", "fire", "landslide", "storm", "roadblock", 
+        "accident", "medical", "marine_emergency", "pollution", 
+        "infrastructure", "other"
+    ] = "other"
+    severity: Literal["low", "medium", "high", "critical"] = "medium"
+    peopleAtRisk: bool = False
+    tags: List[str] = []
+    extractedLocation: Optional[str] = None
+    confidence: Literal["high", "medium", "low"] = "medium"
+    
+    @field_validator('title', 'description', 'hazardType', 'severity', 'peopleAtRisk', 'tags', 'confidence', mode='before')
+    def null_to_default(cls, v, info):
+        # Gemini sometimes returns explicit nulls; treat them like missing keys
+        if v is None:
+            return cls.model_fields[info.field_name].get_default()
+        return v
+    
+    @field_validator('title')
+    def truncate_title(cls, v):
+        return v[:200]
+    
+    @field_validator('description')
+    def truncate_description(cls, v):
+        return v[:2000]
+    
+    @field_validator('tags')
+    def truncate_tags(cls, v):
+        return v[:10]
 
 
 class UpdateReportStatusRequest(BaseModel):
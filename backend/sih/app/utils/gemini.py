@@ -5,27 +5,249 @@ Uses Google Cloud service account credentials (same as GCS)
 import google.generativeai as genai
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterable
+import asyncio
 import json
 import base64
 import httpx
+from pydantic import ValidationError
 from app.config import get_settings
+from app.schemas import GeminiReportExtraction
+from app.utils.report_cache import voice_report_cache
 
 settings = get_settings()
 
+# Static instructions sent with every voice report; built once at import
+_PROMPT_BASE = """You are an AI assistant helping to process emergency/coastal hazard reports from voice notes.
+
+Analyze the audio and extract the following information in JSON format:
+
+{
+  "title": "A brief title (max 200 chars) summarizing the report",
+  "description": "Detailed description of what the person reported (max 2000 chars)",
+  "hazardType": "One of: flood, fire, landslide, storm, roadblock, accident, medical, marine_emergency, pollution, infrastructure, other",
+  "severity": "One of: low, medium, high, critical",
+  "peopleAtRisk": true/false (whether people are in immediate danger),
+  "tags": ["array", "of", "relevant", "keywords"],
+  "extractedLocation": "Any location mentioned (city, landmark, address) or null",
+  "confidence": "high/medium/low (your confidence in the extraction)"
+}
+
+Guidelines:
+- If hazard type is unclear, use "other"
+- Severity assessment: low (minor issue), medium (needs attention), high (urgent), critical (life-threatening)
+- Extract all relevant keywords for tags
+- If location is mentioned, extract it verbatim
+
+Respond ONLY with valid JSON, no additional text."""
+
+_GEMINI_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{settings.GEMINI_MODEL}:generateContent"
+_EMBED_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/text-embedding-004:embedContent"
+_UPLOAD_API_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+
+# Resumable upload chunks must be multiples of 256 KiB (except the last)
+_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Extra Gemini calls allowed when its JSON fails schema validation
+_MAX_VALIDATION_RETRIES = 2
+
+# Stands in for inline audio while the request body is JSON-encoded
+_AUDIO_PLACEHOLDER = "__AUDIO_BASE64__"
+
+# Voice notes larger than this are rejected before any Gemini traffic
+MAX_AUDIO_BYTES = 25 * 1024 * 1024
+
+# (offset, magic bytes, MIME type) used to sniff the real audio format
+_AUDIO_MAGIC = (
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"\xff\xfb", "audio/mpeg"),
+    (0, b"\xff\xf3", "audio/mpeg"),
+    (0, b"\xff\xf2", "audio/mpeg"),
+    (0, b"\xff\xf1", "audio/aac"),
+    (0, b"\xff\xf9", "audio/aac"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"\x1a\x45\xdf\xa3", "audio/webm"),
+    (8, b"WAVE", "audio/wav"),
+    (4, b"ftyp", "audio/mp4"),
+)
+
+
+class UnsupportedAudioError(ValueError):
+    """Uploaded voice note is not a recognised audio format (a client error, not a Gemini failure)"""
+
+
+# Service account credentials, built once and refreshed only when the token is near expiry
+_credentials = None
+
+
 # Configure Gemini API with service account credentials
-def _get_gemini_access_token():
+async def _get_gemini_access_token() -> str:
     """Get access token from service account credentials for Gemini API"""
-    credentials_dict = settings.get_gcs_credentials()
-    credentials = service_account.Credentials.from_service_account_info(
-        credentials_dict,
-        scopes=['https://www.googleapis.com/auth/generative-language.tuning']
+    global _credentials
+    if _credentials is None:
+        _credentials = service_account.Credentials.from_service_account_info(
+            settings.get_gcs_credentials(),
+            scopes=['https://www.googleapis.com/auth/generative-language.tuning']
+        )
+    # `valid` is False once the token is within google-auth's refresh margin of expiry;
+    # the refresh is a blocking HTTPS exchange, so it runs off the event loop
+    if not _credentials.valid:
+        await asyncio.to_thread(_credentials.refresh, Request())
+    return _credentials.token
+
+
+async def _fetch_image_part(client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+    """Download an attached image and wrap it as a Gemini inline_data part"""
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"[GEMINI] Skipping context image {url[:80]}: {str(e)}")
+        return None
+    
+    mime_type = response.headers.get("content-type", "image/jpeg").split(";")[0]
+    return {
+        "inline_data": {
+            "mime_type": mime_type,
+            "data": base64.b64encode(response.content).decode('utf-8')
+        }
+    }
+
+
+async def _embed_text(text: str) -> list[float]:
+    """Embed text with Gemini text-embedding-004 for duplicate detection"""
+    headers = {
+        "Authorization": f"Bearer {await _get_gemini_access_token()}",
+        "Content-Type": "application/json"
+    }
+    payload = {"content": {"parts": [{"text": text}]}}
+    
+    async with httpx.AsyncClient(timeout=15.0) as client:
+        response = await client.post(_EMBED_API_URL, json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()["embedding"]["values"]
+
+
+def sniff_audio_mime(header: bytes) -> Optional[str]:
+    """Detect the audio MIME type from the first bytes of a file, or None if not audio"""
+    for offset, magic, mime_type in _AUDIO_MAGIC:
+        if header.startswith(magic, offset):
+            return mime_type
+    return None
+
+
+async def _prepend_chunk(first: bytes, rest: AsyncIterable[bytes]) -> AsyncIterable[bytes]:
+    """Re-attach a chunk that was read ahead for sniffing"""
+    if first:
+        yield first
+    async for chunk in rest:
+        yield chunk
+
+
+def _candidate_text(result: Dict[str, Any]) -> Optional[str]:
+    """Return the text of the first candidate in a generateContent response"""
+    candidates = result.get("candidates") or []
+    if candidates:
+        content = candidates[0].get("content", {})
+        if "parts" in content:
+            return content["parts"][0]["text"]
+    return None
+
+
+def _parse_extraction(response_text: str) -> Dict[str, Any]:
+    """Strip markdown fences from Gemini output and validate it as a report extraction"""
+    response_text = response_text.strip()
+    if response_text.startswith("```json"):
+        response_text = response_text[7:]
+    if response_text.startswith("```"):
+        response_text = response_text[3:]
+    if response_text.endswith("```"):
+        response_text = response_text[:-3]
+    response_text = response_text.strip()
+    
+    return GeminiReportExtraction.model_validate(json.loads(response_text)).model_dump()
+
+
+def _encode_request(contents: list, audio_base64: Optional[bytes]) -> bytes:
+    """
+    Serialize a generateContent body, splicing in pre-encoded base64 audio
+    
+    Base64 is already JSON-safe, so the (often megabyte-sized) audio string is
+    joined into the bytes directly instead of being escaped by json.dumps.
+    """
+    body = json.dumps({"contents": contents}, separators=(",", ":")).encode("utf-8")
+    if audio_base64 is None:
+        return body
+    head, tail = body.split(f'"{_AUDIO_PLACEHOLDER}"'.encode(), 1)
+    return b"".join((head, b'"', audio_base64, b'"', tail))
+
+
+async def _upload_audio_stream(
+    client: httpx.AsyncClient,
+    access_token: str,
+    audio_stream: AsyncIterable[bytes],
+    size_hint: int,
+    mime_type: str
+) -> str:
+    """
+    Stream audio into the Gemini File API with a resumable upload
+    
+    Only one chunk is held in memory at a time, regardless of audio length.
+    
+    Returns:
+        File URI to reference from generateContent
+    """
+    start = await client.post(
+        _UPLOAD_API_URL,
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "X-Goog-Upload-Protocol": "resumable",
+            "X-Goog-Upload-Command": "start",
+            "X-Goog-Upload-Header-Content-Length": str(size_hint),
+            "X-Goog-Upload-Header-Content-Type": mime_type,
+            "Content-Type": "application/json"
+        },
+        json={"file": {"display_name": "voice-report"}}
     )
-    credentials.refresh(Request())
-    return credentials.token
+    start.raise_for_status()
+    session_url = start.headers["x-goog-upload-url"]
+    
+    offset = 0
+    buffer = bytearray()
+    
+    async def send(data: bytes, command: str) -> httpx.Response:
+        response = await client.post(
+            session_url,
+            content=data,
+            headers={
+                "X-Goog-Upload-Command": command,
+                "X-Goog-Upload-Offset": str(offset)
+            }
+        )
+        response.raise_for_status()
+        return response
+    
+    async for chunk in audio_stream:
+        buffer += chunk
+        # Keep the tail in the buffer so the final request can carry "finalize"
+        while len(buffer) > _UPLOAD_CHUNK_SIZE:
+            await send(bytes(buffer[:_UPLOAD_CHUNK_SIZE]), "upload")
+            offset += _UPLOAD_CHUNK_SIZE
+            del buffer[:_UPLOAD_CHUNK_SIZE]
+    
+    response = await send(bytes(buffer), "upload, finalize")
+    return response.json()["file"]["uri"]
 
 
-async def process_voice_report(audio_url: str, audio_file_data: bytes = None, context: Dict[str, Any] = None) -> Dict[str, Any]:
+async def process_voice_report(
+    audio_url: str,
+    audio_file_data: bytes = None,
+    context: Dict[str, Any] = None,
+    audio_stream: AsyncIterable[bytes] = None,
+    size_hint: int = None,
+    image_urls: list[str] = None
+) -> Dict[str, Any]:
     """
     Process voice note through Gemini to extract structured report data
     
@@ -33,6 +255,13 @@ async def process_voice_report(audio_url: str, audio_file_data: bytes = None, co
         audio_url: URL of the audio file in GCS
         audio_file_data: Optional raw audio data if not yet uploaded
         context: Optional context like attached images, location, etc.
+        audio_stream: Optional audio chunks, streamed via the File API instead
+            of being buffered and inlined (requires size_hint)
+        size_hint: Total size in bytes of audio_stream
+        image_urls: Optional image URLs, downloaded while the audio uploads
+    
+    The audio format is sniffed from its magic bytes; oversized or non-audio
+    input is rejected before any Gemini request is made.
     
     Returns:
         Dict with extracted fields:
@@ -46,134 +275,149 @@ async def process_voice_report(audio_url: str, audio_file_data: bytes = None, co
             "tags": list[str]
         }
     """
+    # Closed on every exit path so an open GCS reader behind the stream is released
+    source_stream = audio_stream
     try:
         print("[GEMINI] Processing voice report with Gemini AI...")
         
-        if not audio_file_data:
+        # Cheap pre-flight checks before spending network or Gemini quota
+        if audio_stream is not None:
+            if not size_hint:
+                raise ValueError("size_hint is required when streaming audio")
+            audio_size = size_hint
+            iterator = aiter(audio_stream)
+            first_chunk = await anext(iterator, b"")
+            header = first_chunk[:16]
+            audio_stream = _prepend_chunk(first_chunk, iterator)
+        elif not audio_file_data:
             raise ValueError("Audio file data is required for processing")
+        else:
+            audio_size = len(audio_file_data)
+            header = audio_file_data[:16]
         
-        # Build the prompt
-        prompt = """You are an AI assistant helping to process emergency/coastal hazard reports from voice notes.
-
-Analyze the audio and extract the following information in JSON format:
-
-{
-  "title": "A brief title (max 200 chars) summarizing the report",
-  "description": "Detailed description of what the person reported (max 2000 chars)",
-  "hazardType": "One of: flood, fire, landslide, storm, roadblock, accident, medical, marine_emergency, pollution, infrastructure, other",
-  "severity": "One of: low, medium, high, critical",
-  "peopleAtRisk": true/false (whether people are in immediate danger),
-  "tags": ["array", "of", "relevant", "keywords"],
-  "extractedLocation": "Any location mentioned (city, landmark, address) or null",
-  "confidence": "high/medium/low (your confidence in the extraction)"
-}
-
-Guidelines:
-- If hazard type is unclear, use "other"
-- Severity assessment: low (minor issue), medium (needs attention), high (urgent), critical (life-threatening)
-- Extract all relevant keywords for tags
-- If location is mentioned, extract it verbatim
-
-Respond ONLY with valid JSON, no additional text."""
+        if audio_size > MAX_AUDIO_BYTES:
+            raise ValueError(f"Audio file too large ({audio_size} bytes, max {MAX_AUDIO_BYTES})")
+        
+        mime_type = sniff_audio_mime(header)
+        if mime_type is None:
+            raise UnsupportedAudioError("Unsupported or corrupt audio file")
         
-        # Add context if provided
+        # Static prompt is shared; only the short context tail is built per call
+        parts = [_PROMPT_BASE]
         if context:
-            prompt += "\n\nAdditional Context:"
+            parts.append("\n\nAdditional Context:")
             if context.get("has_images"):
-                prompt += f"\n- {context['has_images']} image(s) attached"
+                parts.append(f"\n- {context['has_images']} image(s) attached")
             if context.get("has_videos"):
-                prompt += f"\n- {context['has_videos']} video(s) attached"
+                parts.append(f"\n- {context['has_videos']} video(s) attached")
             if context.get("location"):
-                prompt += f"\n- GPS Location: {context['location']}"
+                parts.append(f"\n- GPS Location: {context['location']}")
+        prompt = "".join(parts)
         
         # Get access token
-        access_token = _get_gemini_access_token()
-        
-        # Encode audio as base64
-        audio_base64 = base64.b64encode(audio_file_data).decode('utf-8')
-        
-        # Determine MIME type (default to mp3)
-        mime_type = "audio/mpeg"
+        access_token = await _get_gemini_access_token()
         
         # Call Gemini API using REST endpoint
-        api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{settings.GEMINI_MODEL}:generateContent"
+        api_url = _GEMINI_API_URL
         
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
         
-        payload = {
-            "contents": [{
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            audio_base64 = None
+            image_fetch = asyncio.gather(*(_fetch_image_part(client, url) for url in image_urls or []))
+            if audio_stream is not None:
+                # Context images download while the audio streams to the File API
+                file_uri, fetched = await asyncio.gather(
+                    _upload_audio_stream(client, access_token, audio_stream, size_hint, mime_type),
+                    image_fetch
+                )
+                audio_part = {
+                    "file_data": {
+                        "mime_type": mime_type,
+                        "file_uri": file_uri
+                    }
+                }
+            else:
+                fetched = await image_fetch
+                # Encode audio as base64; spliced into the body by _encode_request
+                audio_base64 = base64.b64encode(audio_file_data)
+                audio_part = {
+                    "inline_data": {
+                        "mime_type": mime_type,
+                        "data": _AUDIO_PLACEHOLDER
+                    }
+                }
+            
+            contents = [{
+                "role": "user",
                 "parts": [
                     {"text": prompt},
-                    {
-                        "inline_data": {
-                            "mime_type": mime_type,
-                            "data": audio_base64
-                        }
-                    }
+                    audio_part,
+                    *(part for part in fetched if part)
                 ]
             }]
-        }
-        
-        print(f"[GEMINI] Calling API: {api_url}")
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(api_url, json=payload, headers=headers)
-            response.raise_for_status()
-            result = response.json()
-        
-        # Parse the response
-        if "candidates" in result and len(result["candidates"]) > 0:
-            candidate = result["candidates"][0]
-            if "content" in candidate and "parts" in candidate["content"]:
-                response_text = candidate["content"]["parts"][0]["text"]
+            
+            # Invalid output is sent back to Gemini with the error so it can correct itself
+            for attempt in range(_MAX_VALIDATION_RETRIES + 1):
+                print(f"[GEMINI] Calling API: {api_url}")
                 
-                # Clean up response text
-                response_text = response_text.strip()
-                if response_text.startswith("```json"):
-                    response_text = response_text[7:]
-                if response_text.startswith("```"):
-                    response_text = response_text[3:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-                response_text = response_text.strip()
+                response = await client.post(
+                    api_url,
+                    content=_encode_request(contents, audio_base64),
+                    headers=headers
+                )
+                response.raise_for_status()
                 
-                # Parse JSON
-                extracted_data = json.loads(response_text)
+                response_text = _candidate_text(response.json())
+                if response_text is None:
+                    raise ValueError("Failed to get valid response from Gemini API")
                 
-                # Validate and normalize
-                result = {
-                    "title": extracted_data.get("title", "Voice Report")[:200],
-                    "description": extracted_data.get("description", "")[:2000],
-                    "hazardType": extracted_data.get("hazardType", "other"),
-                    "severity": extracted_data.get("severity", "medium"),
-                    "peopleAtRisk": extracted_data.get("peopleAtRisk", False),
-                    "tags": extracted_data.get("tags", [])[:10],
-                    "extractedLocation": extracted_data.get("extractedLocation"),
-                    "confidence": extracted_data.get("confidence", "medium"),
-                    "processed_by": "gemini",
-                    "model": settings.GEMINI_MODEL
-                }
-                
-                print(f"[GEMINI] Successfully extracted data: {result['title']}")
-                return result
+                try:
+                    extracted_data = _parse_extraction(response_text)
+                    break
+                except (json.JSONDecodeError, ValidationError) as e:
+                    if attempt == _MAX_VALIDATION_RETRIES:
+                        raise
+                    print(f"[GEMINI] Output failed validation, retrying: {str(e)}")
+                    contents.append({"role": "model", "parts": [{"text": response_text}]})
+                    contents.append({"role": "user", "parts": [{"text": f"Your output had error: {e}. Fix and retry."}]})
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+        
+        result = {
+            **extracted_data,
+            "processed_by": "gemini",
+            "model": settings.GEMINI_MODEL
+        }
         
-        raise ValueError("Failed to get valid response from Gemini API")
+        print(f"[GEMINI] Successfully extracted data: {result['title']}")
+        return result
         
+    except UnsupportedAudioError:
+        raise
     except json.JSONDecodeError as e:
         print(f"[GEMINI ERROR] Failed to parse JSON: {str(e)}")
         raise ValueError(f"Failed to parse Gemini response as JSON: {str(e)}")
+    except ValidationError as e:
+        print(f"[GEMINI ERROR] Response failed validation: {str(e)}")
+        raise ValueError(f"Gemini response failed validation: {str(e)}")
     except Exception as e:
         print(f"[GEMINI ERROR] {str(e)}")
         raise Exception(f"Error processing audio with Gemini: {str(e)}")
+    finally:
+        if source_stream is not None and hasattr(source_stream, "aclose"):
+            await source_stream.aclose()
 
 
 async def process_voice_with_images(
-    audio_file_data: bytes,
+    audio_file_data: bytes = None,
     image_urls: list[str] = None,
-    location: Dict[str, Any] = None
+    location: Dict[str, Any] = None,
+    transcript: Optional[str] = None,
+    audio_stream: AsyncIterable[bytes] = None,
+    size_hint: int = None
 ) -> Dict[str, Any]:
     """
     Process voice report with additional context from images and location
@@ -183,15 +427,47 @@ async def process_voice_with_images(
     - User optionally attaches images for context
     - Gemini processes both audio and images to understand the full situation
     
+    Image URLs must be readable without auth (e.g. signed download URLs);
+    they are fetched concurrently with each other and with the audio upload.
+    
+    If the client sends an on-device transcript, it is matched against recent
+    nearby transcripts first and a near-duplicate skips Gemini entirely. Only
+    reports with a transcript are embedded or cached.
+    
     Returns structured report data extracted from voice + image context
     """
+    coordinates = (location or {}).get("coordinates") or []
+    lng, lat = coordinates if len(coordinates) == 2 else (None, None)
+    
+    transcript_vector = None
+    if transcript and lat is not None:
+        try:
+            transcript_vector = await _embed_text(transcript)
+            cached = await voice_report_cache.lookup_async(transcript_vector, lng, lat)
+        except Exception as e:
+            print(f"[GEMINI] Duplicate lookup failed: {str(e)}")
+            cached = None
+        if cached:
+            print(f"[GEMINI] Reusing extraction for nearby duplicate: {cached['title']}")
+            cached["processed_by"] = "gemini_cache"
+            return cached
+    
     context = {
         "has_images": len(image_urls) if image_urls else 0,
         "location": location
     }
     
-    return await process_voice_report(
+    result = await process_voice_report(
         audio_url=None,
         audio_file_data=audio_file_data,
-        context=context
+        context=context,
+        audio_stream=audio_stream,
+        size_hint=size_hint,
+        image_urls=image_urls
     )
+    
+    # Reuse the lookup embedding, so caching costs no extra Gemini call
+    if transcript_vector is not None:
+        voice_report_cache.add(transcript_vector, result, lng, lat)
+    
+    return result
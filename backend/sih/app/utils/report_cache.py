@@ -0,0 +1,98 @@
+"""
+In-process semantic cache for near-duplicate voice reports
+Reports describing the same event close together reuse one Gemini extraction
+"""
+import asyncio
+import math
+import operator
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List
+
+# Match thresholds: same event = similar wording, nearby, recent
+SIMILARITY_THRESHOLD = 0.92
+MAX_DISTANCE_METERS = 500
+TTL_SECONDS = 15 * 60
+MAX_ENTRIES = 256
+
+EARTH_RADIUS_METERS = 6378100
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+def vector_norm(a: List[float]) -> float:
+    """Euclidean length of an embedding vector"""
+    return math.sqrt(_dot(a, a))
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity between two embedding vectors"""
+    norm = vector_norm(a) * vector_norm(b)
+    return _dot(a, b) / norm if norm else 0.0
+
+
+def haversine_meters(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    """Great-circle distance between two [lng, lat] points in meters"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    h = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(h))
+
+
+class SemanticReportCache:
+    """Bounded cache of (embedding, extraction, location, timestamp) entries"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL_SECONDS):
+        self._entries = deque(maxlen=max_entries)
+        self._ttl = ttl
+
+    def _evict_expired(self, now: float):
+        while self._entries and now - self._entries[0]["ts"] > self._ttl:
+            self._entries.popleft()
+
+    def _best_match(self, entries: List[Dict[str, Any]], vector: List[float],
+                    lng: float, lat: float) -> Optional[Dict[str, Any]]:
+        query_norm = vector_norm(vector)
+        if not query_norm:
+            return None
+
+        best, best_score = None, SIMILARITY_THRESHOLD
+        for entry in entries:
+            if haversine_meters(lng, lat, entry["lng"], entry["lat"]) > MAX_DISTANCE_METERS:
+                continue
+            # Entry norms are stored at insert time, so only the dot product is computed here
+            score = _dot(vector, entry["vector"]) / (query_norm * entry["norm"]) if entry["norm"] else 0.0
+            if score >= best_score:
+                best, best_score = entry, score
+
+        return dict(best["result"]) if best else None
+
+    def lookup(self, vector: List[float], lng: float, lat: float) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction for the closest matching event, if any"""
+        self._evict_expired(time.time())
+        return self._best_match(list(self._entries), vector, lng, lat)
+
+    async def lookup_async(self, vector: List[float], lng: float, lat: float) -> Optional[Dict[str, Any]]:
+        """lookup() with the similarity scan on a worker thread, off the event loop"""
+        self._evict_expired(time.time())
+        # Scan a snapshot so add() on the loop can't mutate the deque mid-iteration
+        return await asyncio.to_thread(self._best_match, list(self._entries), vector, lng, lat)
+
+    def add(self, vector: List[float], result: Dict[str, Any], lng: float, lat: float):
+        """Store an extraction; oldest entries drop off once the cache is full"""
+        now = time.time()
+        self._evict_expired(now)
+        self._entries.append({
+            "vector": vector,
+            "norm": vector_norm(vector),
+            "result": dict(result),
+            "lng": lng,
+            "lat": lat,
+            "ts": now
+        })
+
+
+voice_report_cache = SemanticReportCache()
@@ -4,8 +4,10 @@ Google Cloud Storage utilities for file uploads
 from google.cloud import storage
 from google.oauth2 import service_account
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, AsyncIterator
+import asyncio
 import json
+import mimetypes
 from app.config import get_settings
 
 settings = get_settings()
@@ -21,7 +23,8 @@ def get_gcs_client():
 def generate_signed_upload_url(
     file_name: str,
     content_type: str,
-    expires_in: int = 3600
+    expires_in: int = 3600,
+    resumable: bool = False
 ) -> dict:
     """
     Generate a signed URL for uploading a file to GCS
@@ -30,15 +33,31 @@ def generate_signed_upload_url(
         file_name: Name of the file
         content_type: MIME type of the file
         expires_in: URL expiration time in seconds (default: 1 hour)
+        resumable: Sign a POST that starts a resumable upload session
+                   (client sends "x-goog-resumable: start", then PUTs chunks to the Location URI)
     
     Returns:
-        dict with 'url' and 'fileName'
+        dict with 'url' and 'fileName' (plus 'resumable': True for resumable URLs)
     """
     try:
         client = get_gcs_client()
         bucket = client.bucket(settings.GOOGLE_CLOUD_BUCKET_NAME)
         blob = bucket.blob(file_name)
         
+        if resumable:
+            url = blob.generate_signed_url(
+                version="v4",
+                expiration=timedelta(seconds=expires_in),
+                method="POST",
+                content_type=content_type,
+                headers={"x-goog-resumable": "start"},
+            )
+            return {
+                "url": url,
+                "fileName": file_name,
+                "resumable": True
+            }
+        
         url = blob.generate_signed_url(
             version="v4",
             expiration=timedelta(seconds=expires_in),
@@ -86,6 +105,23 @@ def generate_signed_download_url(
         raise
 
 
+async def iter_blob_chunks(blob, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+    """
+    Stream a GCS blob in chunks without buffering the whole object
+    
+    Blocking reads run in a worker thread so the event loop stays free.
+    """
+    reader = await asyncio.to_thread(blob.open, "rb", chunk_size=chunk_size)
+    try:
+        while True:
+            chunk = await asyncio.to_thread(reader.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        reader.close()
+
+
 def generate_media_urls(media_items: list, expires_in: int = 3600) -> list:
     """
     Generate signed download URLs for a list of media items
@@ -101,9 +137,7 @@ def generate_media_urls(media_items: list, expires_in: int = 3600) -> list:
     for item in media_items:
         try:
             signed_url = generate_signed_download_url(item.get("fileName"), expires_in)
-            item_copy = item.copy()
-            item_copy["url"] = signed_url
-            result.append(item_copy)
+            result.append({**item, "url": signed_url})
         except Exception as e:
             print(f"❌ Error generating URL for {item.get('fileName')}: {str(e)}")
             # Keep original URL if signing fails
@@ -112,68 +146,79 @@ def generate_media_urls(media_items: list, expires_in: int = 3600) -> list:
     return result
 
 
-def validate_file_type(filename: str) -> tuple[bool, Optional[str]]:
+# Allowed upload extensions and their MIME types
+_EXT_TO_MIME = {
+    # Images
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'bmp': 'image/bmp',
+    # Videos
+    'mp4': 'video/mp4',
+    'avi': 'video/x-msvideo',
+    'mov': 'video/quicktime',
+    'wmv': 'video/x-ms-wmv',
+    'flv': 'video/x-flv',
+    'mkv': 'video/x-matroska',
+    'webm': 'video/webm',
+    # Audio
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'ogg': 'audio/ogg',
+    'aac': 'audio/aac',
+    'm4a': 'audio/mp4',
+    # Documents
+    'pdf': 'application/pdf',
+    'doc': 'application/msword',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'xls': 'application/vnd.ms-excel',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'txt': 'text/plain'
+}
+_ALLOWED_EXT = frozenset(_EXT_TO_MIME)
+
+
+def classify_file(filename: str) -> tuple[bool, Optional[str], Optional[str]]:
     """
-    Validate file type based on extension
+    Validate file type and resolve its MIME type with a single extension lookup
     
     Returns:
-        (is_valid, error_message)
+        (is_valid, content_type, error_message)
     """
-    allowed_extensions = {
-        # Images
-        'jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp',
-        # Videos
-        'mp4', 'avi', 'mov', 'wmv', 'flv', 'mkv', 'webm',
-        # Audio
-        'mp3', 'wav', 'ogg', 'aac', 'm4a',
-        # Documents
-        'pdf', 'doc', 'docx', 'xls', 'xlsx', 'txt'
-    }
+    dot = filename.rfind('.') if filename else -1
+    if dot < 0:
+        return False, None, "Invalid filename"
     
-    if not filename or '.' not in filename:
-        return False, "Invalid filename"
+    extension = filename[dot + 1:].lower()
+    content_type = _EXT_TO_MIME.get(extension)
     
-    extension = filename.rsplit('.', 1)[1].lower()
+    if content_type is None:
+        return False, None, f"File type .{extension} is not allowed"
     
-    if extension not in allowed_extensions:
-        return False, f"File type .{extension} is not allowed"
+    return True, content_type, None
+
+
+def validate_file_type(filename: str) -> tuple[bool, Optional[str]]:
+    """
+    Validate file type based on extension
     
-    return True, None
+    Returns:
+        (is_valid, error_message)
+    """
+    is_valid, _, error = classify_file(filename)
+    return is_valid, error
 
 
 def get_content_type(filename: str) -> str:
     """Get MIME type based on file extension"""
-    extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+    dot = filename.rfind('.')
+    extension = filename[dot + 1:].lower() if dot >= 0 else ''
     
-    content_types = {
-        # Images
-        'jpg': 'image/jpeg',
-        'jpeg': 'image/jpeg',
-        'png': 'image/png',
-        'gif': 'image/gif',
-        'webp': 'image/webp',
-        'bmp': 'image/bmp',
-        # Videos
-        'mp4': 'video/mp4',
-        'avi': 'video/x-msvideo',
-        'mov': 'video/quicktime',
-        'wmv': 'video/x-ms-wmv',
-        'flv': 'video/x-flv',
-        'mkv': 'video/x-matroska',
-        'webm': 'video/webm',
-        # Audio
-        'mp3': 'audio/mpeg',
-        'wav': 'audio/wav',
-        'ogg': 'audio/ogg',
-        'aac': 'audio/aac',
-        'm4a': 'audio/mp4',
-        # Documents
-        'pdf': 'application/pdf',
-        'doc': 'application/msword',
-        'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-        'xls': 'application/vnd.ms-excel',
-        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        'txt': 'text/plain'
-    }
+    content_type = _EXT_TO_MIME.get(extension)
+    if content_type is None:
+        # Uncommon extensions fall back to the stdlib table
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
     
-    return content_types.get(extension, 'application/octet-stream')
+    return content_type
@@ -2,28 +2,37 @@
 Validation utilities
 """
 import re
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL_RE = re.compile(rf'^{_EMAIL_PATTERN}$')
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)]')
+_PHONE_RE = re.compile(r'^\+?[1-9]\d{1,14}$')
+
+# Email, or a phone number with formatting characters allowed between digits
+_CREDENTIAL_RE = re.compile(
+    rf'(?:(?P<email>{_EMAIL_PATTERN})'
+    r'|(?P<phone>[\s\-\(\)]*\+?[\s\-\(\)]*[1-9](?:[\s\-\(\)]*\d){1,14}[\s\-\(\)]*))\Z'
+)
 
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_phone(phone: str) -> bool:
     """Validate phone number format"""
     # Remove common formatting characters
-    clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+    clean_phone = _PHONE_FORMATTING_RE.sub('', phone)
     
     # Check if it matches international format
-    pattern = r'^\+?[1-9]\d{1,14}$'
-    return bool(re.match(pattern, clean_phone))
+    return bool(_PHONE_RE.match(clean_phone))
 
 
 def normalize_phone(phone: str) -> str:
     """Normalize phone number to consistent format"""
-    clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+    clean_phone = _PHONE_FORMATTING_RE.sub('', phone)
     if not clean_phone.startswith('+'):
         clean_phone = f'+{clean_phone}'
     return clean_phone
@@ -59,6 +68,39 @@ def validate_credential(credential: str) -> Dict:
         }
 
 
+def _classify_credential(match: Optional[re.Match]) -> Dict:
+    """Build a validate_credential-style result from a _CREDENTIAL_RE match"""
+    if match is None:
+        return {
+            "isValid": False,
+            "type": None,
+            "value": None,
+            "error": "Please provide a valid email address or phone number"
+        }
+    if match.lastgroup == "email":
+        return {
+            "isValid": True,
+            "type": "email",
+            "value": match.group("email").lower(),
+            "error": None
+        }
+    return {
+        "isValid": True,
+        "type": "phone",
+        "value": normalize_phone(match.group("phone")),
+        "error": None
+    }
+
+
+def validate_credentials_batch(credentials: List[str]) -> List[Dict]:
+    """
+    Validate many credentials in one pass (e.g. bulk imports)
+    Returns one validate_credential-style result per input, in order
+    """
+    match = _CREDENTIAL_RE.match
+    return [_classify_credential(match(credential.strip())) for credential in credentials]
+
+
 def sanitize_input(text: str) -> str:
     """Sanitize user input"""
     if not text:
@@ -73,39 +115,46 @@ def validate_registration_data(data: dict) -> Dict:
     """
     errors = {}
     
+    full_name = (data.get("fullName") or "").strip()
+    email = data.get("email")
+    phone = data.get("phone")
+    password = data.get("password")
+    confirm_password = data.get("confirmPassword")
+    role = data.get("role")
+    
     # Full name validation
-    if not data.get("fullName") or len(data["fullName"].strip()) < 1:
+    if not full_name:
         errors["fullName"] = "Full name is required"
-    elif len(data["fullName"]) > 100:
+    elif len(full_name) > 100:
         errors["fullName"] = "Full name cannot exceed 100 characters"
     
     # Email validation
-    if not data.get("email"):
+    if not email:
         errors["email"] = "Email is required"
-    elif not validate_email(data["email"]):
+    elif not validate_email(email):
         errors["email"] = "Please provide a valid email address"
     
     # Phone validation (optional)
-    if data.get("phone"):
-        if not validate_phone(data["phone"]):
+    if phone:
+        if not validate_phone(phone):
             errors["phone"] = "Please provide a valid phone number"
     
     # Password validation
-    if not data.get("password"):
+    if not password:
         errors["password"] = "Password is required"
-    elif len(data["password"]) < 8:
+    elif len(password) < 8:
         errors["password"] = "Password must be at least 8 characters long"
     
     # Confirm password
-    if data.get("password") != data.get("confirmPassword"):
+    if password != confirm_password:
         errors["confirmPassword"] = "Passwords do not match"
     
     # Role validation
-    if data.get("role") not in ["citizen", "official"]:
+    if role not in ("citizen", "official"):
         errors["role"] = "Invalid role"
     
     # Official-specific validation
-    if data.get("role") == "official":
+    if role == "official":
         if not data.get("officialId"):
             errors["officialId"] = "Official ID is required for official accounts"
         if not data.get("organization"):
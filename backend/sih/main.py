@@ -67,6 +67,44 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Health probes (k8s liveness hits /health many times per second) are answered
+# by the outermost middleware, before CORS and timing run
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": "1.0.0"
+}
+ROOT_PAYLOAD = {
+    "message": "Welcome to Samudra Sahayak API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+}
+_PROBE_RESPONSES = {
+    "/health": JSONResponse(HEALTH_PAYLOAD),
+    "/": JSONResponse(ROOT_PAYLOAD)
+}
+
+
+class ProbeShortCircuitMiddleware:
+    """Serve static probe responses without entering the middleware stack"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            response = _PROBE_RESPONSES.get(scope["path"])
+            if response is not None:
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Added last so it wraps every other middleware
+app.add_middleware(ProbeShortCircuitMiddleware)
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -80,22 +118,13 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": "1.0.0"
-    }
+    return HEALTH_PAYLOAD
 
 
 # Root endpoint
 @app.get("/")
 async def root():
-    return {
-        "message": "Welcome to Samudra Sahayak API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return ROOT_PAYLOAD
 
 
 # Include routers
@@ -108,10 +137,14 @@ app.include_router(map_data.router, prefix="/api/map", tags=["Map"])
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
+    # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=True
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=settings.ENVIRONMENT == "development"
     )
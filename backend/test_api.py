@@ -6,10 +6,24 @@ import os
 import sys
 import json
 import time
+import atexit
+import asyncio
+import base64
+import contextlib
+import hashlib
+import importlib.util
+import mmap
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any, List
+from token_cache import load_cached_token, save_token, token_is_fresh
 
 # Configuration
 API_BASE_URL = "http://localhost:8000/api"
@@ -26,18 +40,132 @@ TEST_MEDIA_DIR.mkdir(exist_ok=True)
 (TEST_MEDIA_DIR / "audio").mkdir(exist_ok=True)
 (TEST_MEDIA_DIR / "videos").mkdir(exist_ok=True)
 
+# Compact JSON for log lines
+_SEPS = (",", ":")
+
+# Row extractors for report listings (the backend always returns these fields)
+_USER_REPORT_ROW = itemgetter("title", "hazardType", "severity", "status", "createdAt")
+_PUBLIC_REPORT_ROW = itemgetter("title", "hazardType", "severity", "createdAt")
+_REPORT_ID = itemgetter("id")
+_COMPARISON_ROW = "{:<30} {!s:<25} {!s:<25}".format
+
+# Successful response bodies larger than this (bytes of JSON) are logged as a size stub
+LOG_MAX_BODY = int(os.getenv("TEST_LOG_MAX_BODY", "4096"))
+
+# Fast compact JSON for logs, response bodies and state.json
+try:
+    import orjson as _json
+except ImportError:
+    import types
+    _json = types.SimpleNamespace(
+        dumps=lambda obj: json.dumps(obj, separators=_SEPS, ensure_ascii=False).encode("utf-8"),
+        loads=json.loads
+    )
+
+# Files above this size go through a resumable upload session in 8 MiB chunks
+# (chunk size must be a multiple of 256 KiB for GCS)
+RESUMABLE_THRESHOLD = 8 * 1024 * 1024
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Keys redacted from logged request/response bodies
+_SENSITIVE = frozenset({"password", "confirmPassword", "refreshToken"})
+
+
+# Smallest useful fixtures: an 8x8 mid-grey baseline JPEG (hand-assembled, single DC/AC
+# Huffman code) and a bare MPEG audio frame header. The backend never inspects pixels.
+_TEST_JPEG_BYTES = (
+    b"\xff\xd8"
+    b"\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    b"\xff\xdb\x00\x43\x00" + b"\x01" * 64 +
+    b"\xff\xc0\x00\x0b\x08\x00\x08\x00\x08\x01\x01\x11\x00"
+    b"\xff\xc4\x00\x14\x00\x01" + b"\x00" * 16 +
+    b"\xff\xc4\x00\x14\x10\x01" + b"\x00" * 16 +
+    b"\xff\xda\x00\x08\x01\x01\x00\x00\x3f\x00"
+    b"\x3f"
+    b"\xff\xd9"
+)
+_TEST_MP3_BYTES = b"\xFF\xFB\x90\x00"  # MP3 header
+
+
+def _create_test_image(path: Path):
+    """Create a dummy test image"""
+    path.write_bytes(_TEST_JPEG_BYTES)
+
+
+def _create_test_audio(path: Path):
+    """Create a dummy test audio file"""
+    path.write_bytes(_TEST_MP3_BYTES)
+
+
+_httpx = None
+
+
+def _get_httpx():
+    """Import httpx on first use; only the async runner needs it"""
+    global _httpx
+    if _httpx is None:
+        import httpx
+        _httpx = httpx
+    return _httpx
+
+
+async def _aiter_file(path: Path, chunk_size: int = 256 * 1024):
+    """Yield a file in chunks, doing the blocking reads on a worker thread"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _map_readonly(f):
+    """Read-only mapping of an open file; empty files, which mmap rejects, map to empty bytes"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b"")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+_FIXTURE_CREATORS = {"image": _create_test_image, "audio": _create_test_audio}
+
+
+def _ensure_fixture(path: Path, kind: str) -> Path:
+    """Make sure a test fixture exists, writing it if it is missing"""
+    if not path.exists():
+        _FIXTURE_CREATORS[kind](path)
+    return path
+
 
 class Logger:
     """Structured logging for API requests and responses"""
     
     def __init__(self):
-        self.request_log = LOGS_DIR / "request.log"
-        self.response_log = LOGS_DIR / "response.log"
-        self.error_log = LOGS_DIR / "error.log"
+        # One long-lived buffered handle per log instead of open/append/close per entry
+        self._fps = {
+            name: open(LOGS_DIR / f"{name}.log", "ab", buffering=65536)
+            for name in ("request", "response", "error")
+        }
+        # Disk writes happen on a background thread; the request path only enqueues bytes
+        self._q = queue.Queue(maxsize=10000)
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        # Local-time "YYYY-MM-DDTHH:MM:SS" prefix, re-formatted once per second
+        self._last_sec = 0
+        self._last_prefix = ""
+        
+    def _ts(self) -> str:
+        """ISO-8601 local timestamp with microseconds (same shape as datetime.isoformat)"""
+        ns = time.time_ns()
+        sec = ns // 1_000_000_000
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        return f"{self._last_prefix}.{(ns % 1_000_000_000) // 1000:06d}"
         
     def log_request(self, scenario: str, method: str, url: str, headers: Dict, data: Any = None):
         """Log API request"""
-        timestamp = datetime.now().isoformat()
+        timestamp = self._ts()
         log_entry = {
             "timestamp": timestamp,
             "scenario": scenario,
@@ -46,55 +174,95 @@ class Logger:
             "headers": self._sanitize_headers(headers),
             "data": self._sanitize_data(data)
         }
-        self._write_log(self.request_log, log_entry)
-        print(f"[{timestamp}] [{scenario}] {method} {url}")
+        self._write_log("request", log_entry)
+        sys.stdout.write(f"[{timestamp}] [{scenario}] {method} {url}\n")
         
     def log_response(self, scenario: str, status_code: int, response_data: Any, duration: float):
         """Log API response"""
-        timestamp = datetime.now().isoformat()
+        timestamp = self._ts()
+        body = self._sanitize_data(response_data)
+        if status_code < 400:
+            size = len(_json.dumps(body))
+            if size > LOG_MAX_BODY:
+                body = {"_truncated": True, "status_code": status_code, "bytes": size}
         log_entry = {
             "timestamp": timestamp,
             "scenario": scenario,
             "status_code": status_code,
             "duration_ms": round(duration * 1000, 2),
-            "response": self._sanitize_data(response_data)
+            "response": body
         }
-        self._write_log(self.response_log, log_entry)
-        print(f"[{timestamp}] [{scenario}] Status: {status_code} ({duration*1000:.2f}ms)")
+        self._write_log("response", log_entry)
+        sys.stdout.write(f"[{timestamp}] [{scenario}] Status: {status_code} ({duration*1000:.2f}ms)\n")
         
     def log_error(self, scenario: str, error: str, details: Any = None):
         """Log error"""
-        timestamp = datetime.now().isoformat()
+        timestamp = self._ts()
         log_entry = {
             "timestamp": timestamp,
             "scenario": scenario,
             "error": error,
             "details": str(details) if details else None
         }
-        self._write_log(self.error_log, log_entry)
-        print(f"[{timestamp}] [ERROR] [{scenario}] {error}")
+        self._write_log("error", log_entry)
+        sys.stdout.write(f"[{timestamp}] [ERROR] [{scenario}] {error}\n")
         
     def _sanitize_headers(self, headers: Dict) -> Dict:
         """Remove sensitive data from headers"""
-        safe_headers = headers.copy()
-        if "Authorization" in safe_headers:
-            safe_headers["Authorization"] = "Bearer <token>"
-        return safe_headers
+        if "Authorization" not in headers:
+            return headers
+        return {**headers, "Authorization": "Bearer <token>"}
         
     def _sanitize_data(self, data: Any) -> Any:
-        """Remove sensitive data from request/response"""
+        """Remove sensitive data from request/response (copies only when redacting)"""
         if isinstance(data, dict):
+            if _SENSITIVE.isdisjoint(data):
+                return data
             safe_data = data.copy()
-            for key in ["password", "confirmPassword", "refreshToken"]:
-                if key in safe_data:
-                    safe_data[key] = "<redacted>"
+            for key in _SENSITIVE & safe_data.keys():
+                safe_data[key] = "<redacted>"
             return safe_data
         return data
         
-    def _write_log(self, log_file: Path, log_entry: Dict):
-        """Write log entry to file"""
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+    def _write_log(self, kind: str, log_entry: Dict):
+        """Queue a serialized log entry for the writer thread"""
+        self._q.put((self._fps[kind], _json.dumps(log_entry) + b"\n"))
+        
+    def _drain(self):
+        """Writer thread: write queued entries, flushing every 100 or when idle"""
+        pending = 0
+        while True:
+            item = self._q.get()
+            try:
+                if item is None:
+                    return
+                fp, line = item
+                fp.write(line)
+                pending += 1
+                if pending >= 100 or self._q.empty():
+                    for fp in self._fps.values():
+                        fp.flush()
+                    pending = 0
+            finally:
+                self._q.task_done()
+        
+    def flush(self):
+        """Wait for queued log entries to hit disk and flush console output"""
+        if self._thread.is_alive():
+            self._q.join()
+        for fp in self._fps.values():
+            if not fp.closed:
+                fp.flush()
+        sys.stdout.flush()
+            
+    def close(self):
+        """Stop the writer thread, then flush and close all log files"""
+        if self._thread.is_alive():
+            self._q.put(None)
+            self._thread.join()
+        for fp in self._fps.values():
+            if not fp.closed:
+                fp.close()
 
 
 class StateManager:
@@ -102,6 +270,8 @@ class StateManager:
     
     def __init__(self):
         self.state = self._load_state()
+        self._dirty = False
+        atexit.register(self.flush)
         
     def _load_state(self) -> Dict:
         """Load state from file"""
@@ -111,14 +281,25 @@ class StateManager:
         return {}
         
     def save(self):
-        """Save state to file"""
-        with open(STATE_FILE, "w") as f:
-            json.dump(self.state, f, indent=2)
+        """Save state to file (one write, atomically swapped in)"""
+        data = _json.dumps(self.state)
+        tmp = STATE_FILE.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, STATE_FILE)
+            
+    def flush(self):
+        """Save state to file only if it changed since the last save"""
+        if self._dirty:
+            self.save()
+            self._dirty = False
             
     def set(self, key: str, value: Any):
-        """Set state value"""
+        """Set state value (persisted on the next flush)"""
+        if key in self.state and self.state[key] == value:
+            return
         self.state[key] = value
-        self.save()
+        self._dirty = True
         
     def get(self, key: str, default: Any = None) -> Any:
         """Get state value"""
@@ -128,7 +309,27 @@ class StateManager:
         """Delete state value"""
         if key in self.state:
             del self.state[key]
-            self.save()
+            self._dirty = True
+
+
+class RateLimiter:
+    """Backs off only when the API reports it is about to rate-limit us"""
+    
+    def __init__(self, min_remaining: int = 2):
+        self.min_remaining = min_remaining
+        
+    def delay(self, status_code: int, headers) -> float:
+        """Seconds to wait before the next request (0 unless near the limit)"""
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining", self.min_remaining))
+        except ValueError:
+            remaining = self.min_remaining
+        if status_code != 429 and remaining >= self.min_remaining:
+            return 0.0
+        try:
+            return max(float(headers.get("Retry-After", 1)), 0.0)
+        except ValueError:
+            return 1.0
 
 
 class APITester:
@@ -137,13 +338,45 @@ class APITester:
     def __init__(self):
         self.logger = Logger()
         self.state = StateManager()
+        # Transient gateway errors are retried on the pooled connection instead of failing the scenario.
+        # POST is left out so registrations and report submissions are never duplicated.
+        api_retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            raise_on_status=False
+        )
+        api_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=api_retry)
         self.session = requests.Session()
+        self.session.mount("http://", api_adapter)
+        self.session.mount("https://", api_adapter)
+        # Verbs the harness speaks; anything else is rejected before hitting the wire
+        self._verbs = {
+            "GET": self.session.get,
+            "POST": self.session.post,
+            "PUT": self.session.put,
+            "DELETE": self.session.delete,
+        }
+        # Separate keep-alive pool for storage.googleapis.com uploads
+        gcs_retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+        self.gcs_session = requests.Session()
+        self.gcs_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=gcs_retry))
+        # Auth headers are rebuilt only at login, not per request
+        self._auth_headers = {}
+        self._set_access_token(self.state.get("access_token"))
+        self.rate_limiter = RateLimiter()
         
     def _make_request(self, scenario: str, method: str, endpoint: str, 
                       headers: Optional[Dict] = None, data: Optional[Any] = None,
                       files: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict:
         """Make API request with logging"""
-        url = f"{API_BASE_URL}{endpoint}"
+        url = endpoint if endpoint.startswith("http") else API_BASE_URL + endpoint
         headers = headers or {}
         
         # Log request
@@ -152,40 +385,40 @@ class APITester:
         # Make request
         start_time = time.time()
         try:
-            if method == "GET":
-                response = self.session.get(url, headers=headers, params=data)
-            elif method == "POST":
-                if files:
-                    response = self.session.post(url, headers=headers, data=data, files=files)
-                else:
-                    response = self.session.post(url, headers=headers, json=json_data)
-            elif method == "PUT":
-                if json_data:
-                    headers['Content-Type'] = 'application/json'
-                response = self.session.put(url, headers=headers, json=json_data)
-            elif method == "DELETE":
-                response = self.session.delete(url, headers=headers)
-            else:
+            kwargs = {"headers": headers, "timeout": 30}
+            if json_data is not None:
+                kwargs["json"] = json_data
+            elif files:
+                kwargs["files"] = files
+                kwargs["data"] = data
+            elif method == "GET" and data is not None:
+                kwargs["params"] = data
+            elif data is not None:
+                kwargs["data"] = data
+            send = self._verbs.get(method)
+            if send is None:
                 raise ValueError(f"Unsupported method: {method}")
+            response = send(url, **kwargs)
                 
             duration = time.time() - start_time
             
             # Parse response
-            try:
-                response_data = response.json()
-            except:
-                response_data = {"text": response.text}
+            response_data = self._parse_response(response)
                 
             # Log response
             self.logger.log_response(scenario, response.status_code, response_data, duration)
             
+            wait = self.rate_limiter.delay(response.status_code, response.headers)
+            if wait:
+                time.sleep(wait)
+            
             return {
                 "status_code": response.status_code,
                 "data": response_data,
                 "success": response.status_code < 400
             }
             
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             duration = time.time() - start_time
             self.logger.log_error(scenario, str(e), {"url": url, "method": method})
             return {
@@ -194,17 +427,27 @@ class APITester:
                 "success": False
             }
     
-    def _get_auth_headers(self) -> Dict:
-        """Get authentication headers"""
-        access_token = self.state.get("access_token")
+    @staticmethod
+    def _parse_response(response) -> Any:
+        """Decode a JSON body, falling back to raw text (requests or httpx response)"""
+        content = response.content
+        if "application/json" in response.headers.get("content-type", "") and content:
+            try:
+                return _json.loads(content)
+            except ValueError:
+                return {"text": response.text}
+        return {"text": response.text} if content else {}
+    
+    def _set_access_token(self, access_token: Optional[str]):
+        """Persist the access token and rebuild the auth headers"""
         if access_token:
-            return {"Authorization": f"Bearer {access_token}"}
-        return {}
+            self.state.set("access_token", access_token)
+            self._auth_headers = {"Authorization": f"Bearer {access_token}"}
     
     def _verify_gcs_upload(self, gcs_url: str) -> bool:
         """Verify file exists in Google Cloud Storage"""
         try:
-            response = requests.head(gcs_url, timeout=10)
+            response = self.gcs_session.head(gcs_url, timeout=10)
             return response.status_code == 200
         except:
             return False
@@ -302,7 +545,6 @@ class APITester:
             return False
         
         print("✓ Email verified successfully")
-        time.sleep(1)
         
         # Step 4: Login
         print("\n[1.4] Logging in with verified credentials...")
@@ -326,12 +568,13 @@ class APITester:
         refresh_token = response["data"].get("refreshToken")
         user_data = response["data"].get("user", {})
         
-        if access_token:
-            self.state.set("access_token", access_token)
+        self._set_access_token(access_token)
         if refresh_token:
             self.state.set("refresh_token", refresh_token)
         if user_data.get("id"):
             self.state.set("user_id", user_data["id"])
+        # Persist the session now so later single-scenario runs skip /auth/login
+        self.state.flush()
             
         print(f"✓ Login successful")
         print(f"✓ Access token stored")
@@ -357,8 +600,8 @@ class APITester:
         image_path = TEST_MEDIA_DIR / "images" / "test_image.jpg"
         
         # Create test image if doesn't exist
-        if not image_path.exists():
-            self._create_test_image(image_path)
+        _ensure_fixture(image_path, "image")
+        img_size = image_path.stat().st_size
         
         # Get user ID for folder structure
         import uuid
@@ -379,7 +622,7 @@ class APITester:
             "Get Signed URL",
             "POST",
             "/upload/signed-url",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=file_info
         )
         
@@ -402,20 +645,18 @@ class APITester:
         
         print(f"✓ Signed URL obtained")
         print(f"  File will be: {file_name}")
-        time.sleep(0.5)
         
         # Step 3: Upload image to GCS
         print("\n[2.3] Uploading image to Google Cloud Storage...")
         print(f"  Upload URL: {signed_url[:100]}...")
-        print(f"  File size: {image_path.stat().st_size} bytes")
+        print(f"  File size: {img_size} bytes")
         
+        # Stream the file from disk rather than reading it into memory
         with open(image_path, "rb") as f:
-            file_data = f.read()
-            print(f"  Uploading {len(file_data)} bytes...")
-            upload_response = requests.put(
+            upload_response = self.gcs_session.put(
                 signed_url,
-                data=file_data,
-                headers={"Content-Type": "image/jpeg"}
+                data=f,
+                headers={"Content-Type": "image/jpeg", "Content-Length": str(img_size)}
             )
         
         print(f"  PUT Response Status: {upload_response.status_code}")
@@ -429,7 +670,6 @@ class APITester:
             
         print(f"✓ Image uploaded successfully (Status: {upload_response.status_code})")
         print(f"  Final URL: {base_url}")
-        time.sleep(0.5)
         
         # Step 4: Verify upload
         print("\n[2.4] Verifying upload in GCS...")
@@ -456,7 +696,7 @@ class APITester:
             "images": [{
                 "url": base_url,
                 "fileName": file_name,
-                "fileSize": image_path.stat().st_size
+                "fileSize": img_size
             }],
             "videos": [],
             "tags": ["test", "automated"]
@@ -466,7 +706,7 @@ class APITester:
             "Submit Report",
             "POST",
             "/reports",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=report_data
         )
         
@@ -503,7 +743,7 @@ class APITester:
             "Fetch Reports",
             "GET",
             "/reports",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             data={"reportedBy": user_id, "limit": 50}
         )
         
@@ -535,35 +775,29 @@ class APITester:
         
         uploaded_files = []
         
-        # Step 2: Upload image (optional context for Gemini)
-        print("\n[4.2] Uploading context image...")
+        # Step 2-3: Upload context image (optional for Gemini) and voice note (required)
+        print("\n[4.2] Uploading context image and voice note in parallel...")
         image_path = TEST_MEDIA_DIR / "images" / "test_image.jpg"
-        if not image_path.exists():
-            self._create_test_image(image_path)
+        _ensure_fixture(image_path, "image")
+        audio_path = TEST_MEDIA_DIR / "audio" / "test_audio.mp3"
+        _ensure_fixture(audio_path, "audio")
+        
+        uploads = [(image_path, "image", "image/jpeg"), (audio_path, "audio", "audio/mpeg")]
+        with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+            image_info, audio_info = executor.map(lambda args: self._upload_file(*args), uploads)
         
-        image_info = self._upload_file(image_path, "image", "image/jpeg")
         if image_info:
             uploaded_files.append(("image", image_info))
             print(f"✓ Image uploaded: {image_info['fileName']}")
         else:
             return False
         
-        time.sleep(0.5)
-        
-        # Step 3: Upload voice note (required for voice endpoint)
-        print("\n[4.3] Uploading voice note...")
-        audio_path = TEST_MEDIA_DIR / "audio" / "test_audio.mp3"
-        if not audio_path.exists():
-            self._create_test_audio(audio_path)
-            
-        audio_info = self._upload_file(audio_path, "audio", "audio/mpeg")
+        print("\n[4.3] Voice note upload...")
         if audio_info:
             uploaded_files.append(("audio", audio_info))
             print(f"✓ Voice note uploaded: {audio_info['fileName']}")
         else:
             return False
-            
-        time.sleep(0.5)
         
         # Step 4: Verify uploads (non-blocking - files are private in GCS)
         print("\n[4.4] Upload confirmation...")
@@ -572,6 +806,10 @@ class APITester:
             print(f"  ✓ {media_type.capitalize()}: {info['fileName']}")
                 
         # Step 5: Submit voice report (NO form fields - Gemini extracts them)
+        return self._submit_voice_report(audio_info, image_info)
+    
+    def _submit_voice_report(self, audio_info: Dict, image_info: Dict) -> bool:
+        """Submit uploaded audio + context image to /reports/voice for Gemini extraction"""
         print("\n[4.5] Submitting voice report to /api/reports/voice...")
         print("     → Gemini will process audio and extract: title, description, hazardType, etc.")
         
@@ -580,7 +818,7 @@ class APITester:
                 "url": audio_info['url'],
                 "fileName": audio_info['fileName'],
                 "contentType": "audio/mpeg",
-                "fileSize": audio_path.stat().st_size,
+                "fileSize": audio_info['fileSize'],
                 "duration": 5
             },
             "location": {
@@ -592,7 +830,7 @@ class APITester:
                 "url": image_info['url'],
                 "fileName": image_info['fileName'],
                 "contentType": "image/jpeg",
-                "fileSize": image_path.stat().st_size
+                "fileSize": image_info['fileSize']
             }]
             # NO title, description, hazardType, severity - Gemini extracts these!
         }
@@ -601,7 +839,7 @@ class APITester:
             "Submit Voice Report",
             "POST",
             "/reports/voice",  # Changed from /reports to /reports/voice
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=voice_report_data
         )
         
@@ -643,22 +881,23 @@ class APITester:
         # Step 2: Upload multiple images
         print("\n[5.2] Uploading multiple images...")
         num_images = 3
-        uploaded_images = []
-        
-        for i in range(num_images):
-            image_path = TEST_MEDIA_DIR / "images" / f"test_image_{i+1}.jpg"
-            if not image_path.exists():
-                self._create_test_image(image_path)
-                
-            print(f"  Uploading image {i+1}/{num_images}...")
-            image_info = self._upload_file(image_path, "image", "image/jpeg")
-            if image_info:
-                uploaded_images.append(image_info)
-                print(f"  ✓ Image {i+1} uploaded")
-            else:
-                print(f"  ✗ Image {i+1} upload failed")
+        image_paths = [TEST_MEDIA_DIR / "images" / f"test_image_{i+1}.jpg" for i in range(num_images)]
+        for image_path in image_paths:
+            _ensure_fixture(image_path, "image")
+        
+        # Uploads are independent, so run them in parallel over the GCS keep-alive pool
+        print(f"  Uploading {num_images} images in parallel...")
+        with ThreadPoolExecutor(max_workers=num_images) as executor:
+            uploaded_images = list(executor.map(
+                lambda path: self._upload_file(path, "image", "image/jpeg"),
+                image_paths
+            ))
+        
+        for i, image_info in enumerate(uploaded_images, 1):
+            if not image_info:
+                print(f"  ✗ Image {i} upload failed")
                 return False
-            time.sleep(0.3)
+            print(f"  ✓ Image {i} uploaded")
         
         # Step 3: Upload confirmation (verification skipped - files are private)
         print("\n[5.3] Upload confirmation...")
@@ -688,7 +927,7 @@ class APITester:
             "Submit Report Multiple Images",
             "POST",
             "/reports",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=report_data
         )
         
@@ -723,7 +962,7 @@ class APITester:
             "Get Profile",
             "GET",
             "/user/profile",
-            headers=self._get_auth_headers()
+            headers=self._auth_headers
         )
         
         if not response["success"]:
@@ -736,8 +975,6 @@ class APITester:
         print(f"  Email: {profile.get('email')}")
         print(f"  Role: {profile.get('role')}")
         
-        time.sleep(0.5)
-        
         # Step 3: Update profile
         print("\n[6.3] Updating user profile...")
         # Generate unique phone number to avoid duplicates
@@ -753,7 +990,7 @@ class APITester:
             "Update Profile",
             "PUT",
             "/user/profile",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=update_data
         )
         
@@ -763,15 +1000,13 @@ class APITester:
             print(f"✗ Profile update failed")
             self.logger.log_error("Update Profile", "Profile update failed", response["data"])
             
-        time.sleep(0.5)
-        
         # Step 4: Get user settings
         print("\n[6.4] Fetching user settings...")
         response = self._make_request(
             "Get Settings",
             "GET",
             "/user/settings",
-            headers=self._get_auth_headers()
+            headers=self._auth_headers
         )
         
         if response["success"]:
@@ -779,8 +1014,6 @@ class APITester:
             settings = response["data"]
             print(f"  Notifications enabled: {settings.get('notificationsEnabled')}")
         
-        time.sleep(0.5)
-        
         # Step 5: Update settings
         print("\n[6.5] Updating user settings...")
         settings_data = {
@@ -796,7 +1029,7 @@ class APITester:
             "Update Settings",
             "PUT",
             "/user/settings",
-            headers=self._get_auth_headers(),
+            headers=self._auth_headers,
             json_data=settings_data
         )
         
@@ -819,14 +1052,20 @@ class APITester:
         if not self._ensure_logged_in():
             return False
         
+        # Stats and activity are independent GETs (no batch endpoint), so fetch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stats_future = executor.submit(
+                self._make_request, "Get User Stats", "GET", "/user/stats", headers=self._auth_headers
+            )
+            activity_future = executor.submit(
+                self._make_request, "Get Activity Log", "GET", "/user/activity",
+                headers=self._auth_headers, data={"limit": 20}
+            )
+            stats_response, activity_response = stats_future.result(), activity_future.result()
+        
         # Step 2: Get user stats
         print("\n[7.2] Fetching user statistics...")
-        response = self._make_request(
-            "Get User Stats",
-            "GET",
-            "/user/stats",
-            headers=self._get_auth_headers()
-        )
+        response = stats_response
         
         if response["success"]:
             stats = response["data"]
@@ -834,17 +1073,9 @@ class APITester:
             print(f"  Total reports: {stats.get('totalReports', 0)}")
             print(f"  Verified reports: {stats.get('verifiedReports', 0)}")
         
-        time.sleep(0.5)
-        
         # Step 3: Get user activity log
         print("\n[7.3] Fetching user activity log...")
-        response = self._make_request(
-            "Get Activity Log",
-            "GET",
-            "/user/activity",
-            headers=self._get_auth_headers(),
-            data={"limit": 20}
-        )
+        response = activity_response
         
         if response["success"]:
             activities = response["data"].get("activities", [])
@@ -856,30 +1087,41 @@ class APITester:
     
     # ==================== SCENARIO 8: Test Reports Endpoints ====================
     
-    def scenario_8_test_reports_endpoints(self):
+    def scenario_8_test_reports_endpoints(self, force_relogin: bool = True):
         """Test both /api/reports and /api/user/reports endpoints separately"""
         print("\n" + "="*80)
         print("SCENARIO 8: Test Reports Endpoints Comparison")
         print("="*80)
         
-        # Step 1: Login (force fresh login to ensure valid token)
+        # Step 1: Login (force fresh login to ensure valid token, unless the caller already holds one)
         print("\n[8.1] Logging in...")
-        if not self._ensure_logged_in(force_relogin=True):
+        if not self._ensure_logged_in(force_relogin=force_relogin):
             return False
         
         user_id = self.state.get("user_id")
         
+        # Use Mumbai coordinates (where test reports are located)
+        lat = 19.0760
+        lng = 72.8777
+        radius = 50000  # 50km
+        
+        # Steps 2 and 3 are independent GETs, so dispatch both in one round-trip
+        comparison_requests = [
+            ("User Reports", "/user/reports"),
+            ("Public Reports", f"/reports?lat={lat}&lng={lng}&radius={radius}&limit=50&sortBy=createdAt&sortOrder=desc"),
+        ]
+        with ThreadPoolExecutor(max_workers=len(comparison_requests)) as executor:
+            user_response, public_response = executor.map(
+                lambda req: self._make_request(req[0], "GET", req[1], headers=self._auth_headers),
+                comparison_requests
+            )
+        
         # Step 2: Test /api/user/reports (authenticated, user-specific)
         print("\n[8.2] Testing /api/user/reports (user-specific, authenticated)...")
         print("      Endpoint: GET /api/user/reports")
         print("      Description: Returns only reports submitted by current user")
         
-        response = self._make_request(
-            "User Reports",
-            "GET",
-            "/user/reports",
-            headers=self._get_auth_headers()
-        )
+        response = user_response
         
         if not response["success"]:
             self.logger.log_error("User Reports", "Failed to fetch user reports", response["data"])
@@ -890,10 +1132,10 @@ class APITester:
         
         # Show sample reports
         for i, report in enumerate(user_reports[:5], 1):
-            created_at = report.get('createdAt', '')
+            title, hazard, severity, status, created_at = _USER_REPORT_ROW(report)
             if isinstance(created_at, str):
-                created_at = created_at.split('T')[0] if 'T' in created_at else created_at
-            print(f"  [{i}] {report.get('title')} - {report.get('hazardType')} - {report.get('severity')} - {report.get('status')} - {created_at}")
+                created_at = created_at.partition('T')[0]
+            print(f"  [{i}] {title} - {hazard} - {severity} - {status} - {created_at}")
         
         if len(user_reports) > 5:
             print(f"  ... and {len(user_reports) - 5} more")
@@ -902,76 +1144,40 @@ class APITester:
         print("\n[8.3] Testing /api/reports (public, geospatial, all users)...")
         print("      Endpoint: GET /api/reports")
         print("      Description: Returns all public reports near specified location")
+        print("      Query: location $geoWithin $centerSphere [[lng, lat], radius / 6378100]")
         
-        # Use Mumbai coordinates (where test reports are located)
-        lat = 19.0760
-        lng = 72.8777
-        radius = 50000  # 50km
-        
-        response = self._make_request(
-            "Public Reports",
-            "GET",
-            f"/reports?lat={lat}&lng={lng}&radius={radius}&limit=50&sortBy=createdAt&sortOrder=desc",
-            headers=self._get_auth_headers()  # Optional, can work without auth
-        )
+        response = public_response
         
+        # The backend filters with $geoWithin/$centerSphere (served by the location_2dsphere
+        # index it creates at startup), so there is no $near/index-missing error to fall back from
         if not response["success"]:
-            error_detail = response["data"].get("detail", "")
-            if "$geoNear" in str(error_detail) or "$near" in str(error_detail):
-                print("⚠ Geospatial query failed - MongoDB index missing")
-                print("  Note: /api/reports requires a 2dsphere index on 'location' field")
-                print("  Trying without geospatial filter...")
-                
-                # Fallback: Try without location filter
-                response = self._make_request(
-                    "Public Reports (No Geo)",
-                    "GET",
-                    f"/reports?limit=50&sortBy=createdAt&sortOrder=desc",
-                    headers=self._get_auth_headers()
-                )
-                
-                if not response["success"]:
-                    print("  ✗ Fallback also failed - endpoint requires geospatial index")
-                    print("\n[8.3] Skipping /api/reports comparison due to missing MongoDB index")
-                    print("      To fix: Run backend/fix_indexes.py to create 2dsphere index")
-                    # Continue with partial results
-                    public_reports = []
-                    pagination = {}
-                else:
-                    public_reports = response["data"].get("reports", [])
-                    pagination = response["data"].get("pagination", {})
-            else:
-                self.logger.log_error("Public Reports", "Failed to fetch public reports", response["data"])
-                return False
-        else:
-            public_reports = response["data"].get("reports", [])
-            pagination = response["data"].get("pagination", {})
-            
-            # If geospatial query returned 0 results, try without geo to see if reports exist
-            if len(public_reports) == 0:
-                print("  Fetching all reports (no geo filter) to check location data...")
-                response2 = self._make_request(
-                    "Public Reports Check",
-                    "GET",
-                    f"/reports?limit=5&sortBy=createdAt&sortOrder=desc",
-                    headers=self._get_auth_headers()
-                )
-                if response2["success"]:
-                    check_reports = response2["data"].get("reports", [])
-                    if len(check_reports) > 0:
-                        print(f"  Found {len(check_reports)} reports without geo filter. Sample locations:")
-                        for i, r in enumerate(check_reports[:3], 1):
-                            loc = r.get('location', {})
-                            coords = loc.get('coordinates', []) if loc else []
-                            if len(coords) >= 2:
-                                print(f"    [{i}] {r.get('title')[:40]} - Location: [{coords[1]:.4f}, {coords[0]:.4f}]")
-                            else:
-                                print(f"    [{i}] {r.get('title')[:40]} - Location: MISSING")
-                        print(f"  Search center: [{lat}, {lng}], radius: {radius/1000}km")
-        
-        if not 'public_reports' in locals():
-            public_reports = []
-            pagination = {}
+            self.logger.log_error("Public Reports", "Failed to fetch public reports", response["data"])
+            return False
+        
+        public_reports = response["data"].get("reports", [])
+        pagination = response["data"].get("pagination", {})
+        
+        # If geospatial query returned 0 results, try without geo to see if reports exist
+        if len(public_reports) == 0:
+            print("  Fetching all reports (no geo filter) to check location data...")
+            response2 = self._make_request(
+                "Public Reports Check",
+                "GET",
+                f"/reports?limit=5&sortBy=createdAt&sortOrder=desc",
+                headers=self._auth_headers
+            )
+            if response2["success"]:
+                check_reports = response2["data"].get("reports", [])
+                if len(check_reports) > 0:
+                    print(f"  Found {len(check_reports)} reports without geo filter. Sample locations:")
+                    for i, r in enumerate(check_reports[:3], 1):
+                        loc = r.get('location', {})
+                        coords = loc.get('coordinates', []) if loc else []
+                        if len(coords) >= 2:
+                            print(f"    [{i}] {r.get('title')[:40]} - Location: [{coords[1]:.4f}, {coords[0]:.4f}]")
+                        else:
+                            print(f"    [{i}] {r.get('title')[:40]} - Location: MISSING")
+                    print(f"  Search center: [{lat}, {lng}], radius: {radius/1000}km")
         
         if len(public_reports) > 0:
             print(f"✓ Found {len(public_reports)} public report(s) near location")
@@ -984,62 +1190,99 @@ class APITester:
         
         # Show sample reports with reporter info
         for i, report in enumerate(public_reports[:5], 1):
-            created_at = report.get('createdAt', '')
+            title, hazard, severity, created_at = _PUBLIC_REPORT_ROW(report)
             if isinstance(created_at, str):
-                created_at = created_at.split('T')[0] if 'T' in created_at else created_at
+                created_at = created_at.partition('T')[0]
             reporter = report.get('reporterName', 'Unknown')
             location = report.get('location', {})
             coords = location.get('coordinates', []) if location else []
             loc_str = f"[{coords[1]:.4f}, {coords[0]:.4f}]" if len(coords) >= 2 else "No coords"
-            print(f"  [{i}] {report.get('title')} - {report.get('hazardType')} - {report.get('severity')} - by {reporter} - {loc_str} - {created_at}")
+            print(f"  [{i}] {title} - {hazard} - {severity} - by {reporter} - {loc_str} - {created_at}")
         
         if len(public_reports) > 5:
             print(f"  ... and {len(public_reports) - 5} more")
         
         # Step 4: Compare results
-        print("\n[8.4] Comparison Summary:")
-        print("="*80)
-        print(f"{'Aspect':<30} {'User Reports (/user/reports)':<25} {'Public Reports (/reports)':<25}")
-        print("-"*80)
-        print(f"{'Authentication':<30} {'Required ✓':<25} {'Optional':<25}")
-        print(f"{'Total Results':<30} {str(len(user_reports)):<25} {str(len(public_reports)) if public_reports else 'N/A (index missing)':<25}")
-        print(f"{'Scope':<30} {'Current user only':<25} {'All users':<25}")
-        print(f"{'Filter Type':<30} {'User ID':<25} {'Location-based':<25}")
-        print(f"{'Pagination':<30} {'No (limit 100)':<25} {'Yes (page/limit)':<25}")
-        print(f"{'Fields Returned':<30} {'7 fields (summary)':<25} {'15+ fields (full)':<25}")
-        print(f"{'Use Case':<30} {'User profile/dashboard':<25} {'Map view/feed':<25}")
-        print(f"{'Status':<30} {'✓ Working':<25} {'⚠ Needs DB index':<25}")
-        print("="*80)
+        rows = [
+            "\n[8.4] Comparison Summary:",
+            "="*80,
+            _COMPARISON_ROW("Aspect", "User Reports (/user/reports)", "Public Reports (/reports)"),
+            "-"*80,
+            _COMPARISON_ROW("Authentication", "Required ✓", "Optional"),
+            _COMPARISON_ROW("Total Results", len(user_reports), len(public_reports)),
+            _COMPARISON_ROW("Scope", "Current user only", "All users"),
+            _COMPARISON_ROW("Filter Type", "User ID", "Location-based"),
+            _COMPARISON_ROW("Pagination", "No (limit 100)", "Yes (page/limit)"),
+            _COMPARISON_ROW("Fields Returned", "7 fields (summary)", "15+ fields (full)"),
+            _COMPARISON_ROW("Use Case", "User profile/dashboard", "Map view/feed"),
+            _COMPARISON_ROW("Status", "✓ Working", "✓ Working"),
+            "="*80,
+        ]
+        sys.stdout.write("\n".join(rows) + "\n")
         
         if len(public_reports) > 0:
             # Verify user's reports are included in public reports
-            user_report_ids = {r.get('id') for r in user_reports}
-            public_report_ids = {r.get('id') for r in public_reports}
-            overlap = user_report_ids.intersection(public_report_ids)
+            overlap = frozenset(map(_REPORT_ID, user_reports)) & frozenset(map(_REPORT_ID, public_reports))
             
             print(f"\n✓ {len(overlap)} of user's reports appear in public reports")
             if len(user_reports) > len(overlap):
                 print(f"  Note: {len(user_reports) - len(overlap)} user reports are outside the search radius")
         else:
-            print("\n⚠ Could not verify overlap - /api/reports requires MongoDB geospatial index")
-            print("  Run: python backend/fix_indexes.py")
+            print("\n⚠ Could not verify overlap - no public reports within the search radius")
         
         return True
     
     # ==================== HELPER METHODS ====================
     
+    def _refresh_access_token(self) -> bool:
+        """Swap the stored refresh token for a new access token (skips a full password login)"""
+        refresh_token = self.state.get("refresh_token")
+        if not refresh_token:
+            return False
+        
+        response = self._make_request(
+            "Refresh Token",
+            "POST",
+            "/auth/refresh",
+            headers={"Cookie": f"refreshToken={refresh_token}"}
+        )
+        access_token = response["data"].get("accessToken") if response["success"] else None
+        if not access_token:
+            return False
+        
+        self._set_access_token(access_token)
+        # The backend rotates the refresh token and returns it as a cookie
+        rotated = self.session.cookies.get("refreshToken")
+        if rotated:
+            self.state.set("refresh_token", rotated)
+        email = self.state.get("test_user_email")
+        if email:
+            save_token(email, access_token)
+        self.state.flush()
+        return True
+    
     def _ensure_logged_in(self, force_relogin: bool = False) -> bool:
         """Ensure user is logged in, login if necessary"""
         access_token = self.state.get("access_token")
-        
-        if access_token and not force_relogin:
-            print(f"✓ Using existing session")
-            return True
-        
-        # Need to login
         email = self.state.get("test_user_email")
         password = self.state.get("test_user_password")
         
+        if not force_relogin:
+            # Local checks first: the JWT exp claim, then the on-disk token cache
+            if token_is_fresh(access_token):
+                print(f"✓ Using existing session")
+                return True
+            cached_token = load_cached_token(email) if email else None
+            if cached_token:
+                self._set_access_token(cached_token)
+                print(f"✓ Using cached token")
+                return True
+            # Only then spend a round trip on the refresh endpoint
+            if access_token and self._refresh_access_token():
+                print(f"✓ Session refreshed")
+                return True
+        
+        # Need to login
         if not email or not password:
             print("✗ No credentials found. Please run Scenario 1 first.")
             return False
@@ -1065,16 +1308,19 @@ class APITester:
         access_token = response["data"].get("accessToken")
         refresh_token = response["data"].get("refreshToken")
         
+        self._set_access_token(access_token)
         if access_token:
-            self.state.set("access_token", access_token)
+            save_token(email, access_token)
         if refresh_token:
             self.state.set("refresh_token", refresh_token)
+        # Persist the session now so later single-scenario runs skip /auth/login
+        self.state.flush()
             
         print(f"✓ Login successful")
         return True
     
-    def _upload_file(self, file_path: Path, media_type: str, content_type: str) -> Optional[str]:
-        """Upload file to GCS and return URL"""
+    def _upload_object_path(self, file_path: Path, content_type: str) -> Optional[str]:
+        """Build a unique category/user-{id}/name object path for an upload"""
         import uuid
         
         # Get user ID from state
@@ -1101,43 +1347,82 @@ class APITester:
             category = 'documents'
         
         # Create full path: category/user-{userId}/filename
-        full_path = f"{category}/user-{user_id}/{unique_name}"
-        
-        print(f"    Generated path: {full_path}")
-        
-        # Get signed URL
-        file_info = {
-            "fileName": full_path,
-            "contentType": content_type
-        }
-        
-        response = self._make_request(
-            f"Get Signed URL ({media_type})",
-            "POST",
-            "/upload/signed-url",
-            headers=self._get_auth_headers(),
-            json_data=file_info
+        return f"{category}/user-{user_id}/{unique_name}"
+    
+    def _resumable_upload(self, signed_url: str, mm: mmap.mmap, content_type: str) -> requests.Response:
+        """Start a GCS resumable session and PUT the mapping in chunks, resuming from the committed offset"""
+        start = self.gcs_session.post(
+            signed_url,
+            headers={"Content-Type": content_type, "x-goog-resumable": "start"}
         )
-        
-        if not response["success"]:
+        if start.status_code != 201:
+            return start
+        session_uri = start.headers["Location"]
+        
+        total = len(mm)
+        offset = 0
+        while True:
+            end = min(offset + RESUMABLE_CHUNK_SIZE, total)
+            response = self.gcs_session.put(
+                session_uri,
+                data=mm[offset:end],
+                headers={"Content-Range": f"bytes {offset}-{end - 1}/{total}"},
+                allow_redirects=False
+            )
+            if response.status_code != 308:
+                return response
+            # 308 = chunk accepted; "Range: bytes=0-N" is what GCS has committed so far
+            committed = response.headers.get("Range")
+            offset = int(committed.rsplit("-", 1)[1]) + 1 if committed else 0
+    
+    def _upload_file(self, file_path: Path, media_type: str, content_type: str) -> Optional[str]:
+        """Upload file to GCS and return URL"""
+        full_path = self._upload_object_path(file_path, content_type)
+        if not full_path:
             return None
-            
-        # The backend returns {"url": "signed_url", "fileName": "file.jpg"}
-        signed_url = response["data"].get("url")
         
-        if not signed_url:
-            return None
+        print(f"    Generated path: {full_path}")
         
-        # Upload file
-        print(f"    Uploading to GCS: {signed_url[:80]}...")
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-            print(f"    File size: {len(file_data)} bytes")
-            upload_response = requests.put(
-                signed_url,
-                data=file_data,
-                headers={"Content-Type": content_type}
+        # Map the file once: its size, the MD5 and the request body all come from the same pages
+        with open(file_path, "rb") as f, _map_readonly(f) as mm:
+            file_size = len(mm)
+            
+            # Get signed URL (large files get a resumable-session URL instead of a single PUT)
+            resumable = file_size > RESUMABLE_THRESHOLD
+            file_info = {
+                "fileName": full_path,
+                "contentType": content_type,
+                "resumable": resumable
+            }
+            
+            response = self._make_request(
+                f"Get Signed URL ({media_type})",
+                "POST",
+                "/upload/signed-url",
+                headers=self._auth_headers,
+                json_data=file_info
             )
+            
+            if not response["success"]:
+                return None
+            
+            # The backend returns {"url": "signed_url", "fileName": "file.jpg"}
+            signed_url = response["data"].get("url")
+            
+            if not signed_url:
+                return None
+            
+            print(f"    Uploading to GCS: {signed_url[:80]}...")
+            local_md5 = base64.b64encode(hashlib.md5(mm).digest()).decode()
+            print(f"    File size: {file_size} bytes")
+            if resumable:
+                upload_response = self._resumable_upload(signed_url, mm, content_type)
+            else:
+                upload_response = self.gcs_session.put(
+                    signed_url,
+                    data=mm,
+                    headers={"Content-Type": content_type, "Content-Length": str(file_size)}
+                )
         
         print(f"    Upload status: {upload_response.status_code}")
             
@@ -1145,6 +1430,15 @@ class APITester:
             print(f"    Upload failed: {upload_response.text[:200]}")
             return None
         
+        # GCS reports the stored object's hashes as "x-goog-hash: crc32c=...,md5=..."
+        stored_hashes = dict(
+            h.strip().partition("=")[::2] for h in upload_response.headers.get("x-goog-hash", "").split(",") if h.strip()
+        )
+        stored_md5 = stored_hashes.get("md5")
+        if stored_md5 and stored_md5 != local_md5:
+            print(f"    Upload corrupted: local md5 {local_md5} != stored md5 {stored_md5}")
+            return None
+        
         # Return the base URL (without query params) for accessing the file
         base_url = signed_url.split('?')[0]
         print(f"    Final URL: {base_url}")
@@ -1154,28 +1448,9 @@ class APITester:
             "url": base_url,
             "fileName": full_path,
             "contentType": content_type,
-            "fileSize": file_path.stat().st_size
+            "fileSize": file_size
         }
     
-    def _create_test_image(self, path: Path):
-        """Create a dummy test image"""
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            img = Image.new('RGB', (800, 600), color='lightblue')
-            draw = ImageDraw.Draw(img)
-            draw.text((50, 50), f"Test Image\n{datetime.now()}", fill='black')
-            img.save(path)
-        except ImportError:
-            # Fallback: create a simple file
-            with open(path, "wb") as f:
-                f.write(b"\xFF\xD8\xFF\xE0\x00\x10JFIF")  # JPEG header
-    
-    def _create_test_audio(self, path: Path):
-        """Create a dummy test audio file"""
-        # Create a minimal MP3 file
-        with open(path, "wb") as f:
-            f.write(b"\xFF\xFB\x90\x00")  # MP3 header
-    
     def run_all_scenarios(self):
         """Run all test scenarios"""
         print("\n" + "="*80)
@@ -1201,12 +1476,17 @@ class APITester:
             try:
                 result = func()
                 results.append((name, result))
-                time.sleep(2)  # Delay between scenarios
             except Exception as e:
                 self.logger.log_error(name, str(e))
                 results.append((name, False))
+            finally:
+                self.logger.flush()
+                self.state.flush()
         
-        # Print summary
+        return self._print_summary(results)
+    
+    def _print_summary(self, results: List) -> bool:
+        """Print pass/fail table for (name, result) pairs"""
         print("\n" + "="*80)
         print(" TEST SUMMARY")
         print("="*80)
@@ -1226,13 +1506,274 @@ class APITester:
         return passed == total
 
 
+class AsyncAPITester(APITester):
+    """APITester that runs independent read-only scenarios concurrently over httpx"""
+    
+    def __init__(self):
+        super().__init__()
+        # HTTP/2 multiplexes the gathered requests over one connection where the server
+        # negotiates it (TLS/ALPN); plain-http localhost and missing h2 fall back to HTTP/1.1
+        httpx = _get_httpx()
+        self.client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        
+    async def _make_request_async(self, scenario: str, method: str, endpoint: str,
+                                  headers: Optional[Dict] = None, data: Optional[Any] = None,
+                                  json_data: Optional[Dict] = None) -> Dict:
+        """Make API request with logging (async)"""
+        url = endpoint if endpoint.startswith("http") else API_BASE_URL + endpoint
+        headers = headers or {}
+        
+        self.logger.log_request(scenario, method, url, headers, json_data or data)
+        
+        start_time = time.time()
+        try:
+            kwargs = {"headers": headers}
+            if json_data is not None:
+                kwargs["json"] = json_data
+            elif method == "GET" and data is not None:
+                kwargs["params"] = data
+            elif data is not None:
+                kwargs["data"] = data
+            response = await self.client.request(method, endpoint, **kwargs)
+            
+            duration = time.time() - start_time
+            response_data = self._parse_response(response)
+            self.logger.log_response(scenario, response.status_code, response_data, duration)
+            
+            wait = self.rate_limiter.delay(response.status_code, response.headers)
+            if wait:
+                await asyncio.sleep(wait)
+            
+            return {
+                "status_code": response.status_code,
+                "data": response_data,
+                "success": response.status_code < 400
+            }
+            
+        except (_get_httpx().HTTPError, ValueError) as e:
+            duration = time.time() - start_time
+            self.logger.log_error(scenario, str(e), {"url": url, "method": method})
+            return {
+                "status_code": 0,
+                "data": {"error": str(e)},
+                "success": False
+            }
+    
+    async def scenario_3_fetch_user_reports_async(self):
+        """Fetch all user reports (expects an existing login)"""
+        print("\n[3] Fetching user reports...")
+        response = await self._make_request_async(
+            "Fetch Reports",
+            "GET",
+            "/reports",
+            headers=self._auth_headers,
+            data={"reportedBy": self.state.get("user_id"), "limit": 50}
+        )
+        
+        if not response["success"]:
+            self.logger.log_error("Fetch Reports", "Failed to fetch reports", response["data"])
+            return False
+            
+        return True
+    
+    async def scenario_6_user_profile_operations_async(self):
+        """Profile and settings round-trips (expects an existing login)"""
+        headers = self._auth_headers
+        
+        # Profile and settings are independent resources: read both at once
+        print("\n[6] Fetching user profile and settings...")
+        profile, settings = await asyncio.gather(
+            self._make_request_async("Get Profile", "GET", "/user/profile", headers=headers),
+            self._make_request_async("Get Settings", "GET", "/user/settings", headers=headers)
+        )
+        
+        if not profile["success"]:
+            self.logger.log_error("Get Profile", "Failed to fetch profile", profile["data"])
+            return False
+        
+        print(f"✓ Profile fetched: {profile['data'].get('fullName')} ({profile['data'].get('email')})")
+        if settings["success"]:
+            print(f"✓ Settings fetched, notifications enabled: {settings['data'].get('notificationsEnabled')}")
+        
+        update_data = {
+            "fullName": f"Updated User {int(time.time())}",
+            "phone": f"+91{9100000000 + int(time.time()) % 900000000}",
+            "language": "hi",
+            "profession": "Engineer"
+        }
+        settings_data = {
+            "notificationPreferences": {
+                "email": True,
+                "sms": False,
+                "push": True
+            },
+            "language": "en"
+        }
+        
+        # Both PUTs write users.language, so keep the sync order: settings ("en") lands last
+        print("\n[6] Updating user profile and settings...")
+        profile_update = await self._make_request_async("Update Profile", "PUT", "/user/profile",
+                                                        headers=headers, json_data=update_data)
+        settings_update = await self._make_request_async("Update Settings", "PUT", "/user/settings",
+                                                         headers=headers, json_data=settings_data)
+        
+        for name, response in (("Update Profile", profile_update), ("Update Settings", settings_update)):
+            if response["success"]:
+                print(f"✓ {name} succeeded")
+            else:
+                print(f"✗ {name} failed")
+                self.logger.log_error(name, f"{name} failed", response["data"])
+        
+        return True
+    
+    async def scenario_7_user_activity_tracking_async(self):
+        """Stats and activity log fetched concurrently (expects an existing login)"""
+        headers = self._auth_headers
+        
+        print("\n[7] Fetching user statistics and activity log...")
+        stats, activity = await asyncio.gather(
+            self._make_request_async("Get User Stats", "GET", "/user/stats", headers=headers),
+            self._make_request_async("Get Activity Log", "GET", "/user/activity", headers=headers, data={"limit": 20})
+        )
+        
+        if stats["success"]:
+            print(f"✓ Stats fetched: {stats['data'].get('totalReports', 0)} total, "
+                  f"{stats['data'].get('verifiedReports', 0)} verified")
+        if activity["success"]:
+            activities = activity["data"].get("activities", [])
+            print(f"✓ Found {len(activities)} activity record(s)")
+            for i, entry in enumerate(activities[:5], 1):
+                print(f"  [{i}] {entry.get('action')} - {entry.get('timestamp')}")
+        
+        return True
+    
+    async def scenario_8_test_reports_endpoints_async(self):
+        """Endpoint comparison run on a worker thread alongside the async reads"""
+        # run_all() has already logged in; a forced relogin here would swap the token,
+        # headers and state out from under scenarios 3, 6 and 7 running concurrently
+        return await asyncio.to_thread(self.scenario_8_test_reports_endpoints, force_relogin=False)
+    
+    async def _upload_and_attach(self, file_path: Path, media_type: str, content_type: str) -> Optional[Dict]:
+        """Signed URL -> streamed GCS PUT; resolves as soon as GCS acknowledges the write"""
+        full_path = self._upload_object_path(file_path, content_type)
+        if not full_path:
+            return None
+        
+        response = await self._make_request_async(
+            f"Get Signed URL ({media_type})",
+            "POST",
+            "/upload/signed-url",
+            headers=self._auth_headers,
+            json_data={"fileName": full_path, "contentType": content_type}
+        )
+        signed_url = response["data"].get("url") if response["success"] else None
+        if not signed_url:
+            return None
+        
+        file_size = file_path.stat().st_size
+        print(f"    Streaming {file_size} bytes to GCS: {signed_url[:80]}...")
+        upload_response = await self.client.put(
+            signed_url,
+            content=_aiter_file(file_path),
+            headers={"Content-Type": content_type, "Content-Length": str(file_size)}
+        )
+        if upload_response.status_code not in [200, 201]:
+            print(f"    Upload failed: {upload_response.text[:200]}")
+            return None
+        
+        return {
+            "url": signed_url.split('?')[0],
+            "fileName": full_path,
+            "contentType": content_type,
+            "fileSize": file_size
+        }
+    
+    async def scenario_4_submit_report_with_media_async(self):
+        """Voice report with the image and audio uploads running concurrently"""
+        print("\n" + "="*80)
+        print("SCENARIO 4: Voice Report Submission (Gemini AI Processing)")
+        print("="*80)
+        
+        if not self._ensure_logged_in():
+            return False
+        
+        image_path = _ensure_fixture(TEST_MEDIA_DIR / "images" / "test_image.jpg", "image")
+        audio_path = _ensure_fixture(TEST_MEDIA_DIR / "audio" / "test_audio.mp3", "audio")
+        
+        print("\n[4] Uploading context image and voice note...")
+        image_info, audio_info = await asyncio.gather(
+            self._upload_and_attach(image_path, "image", "image/jpeg"),
+            self._upload_and_attach(audio_path, "audio", "audio/mpeg")
+        )
+        if not image_info or not audio_info:
+            return False
+        
+        return self._submit_voice_report(audio_info, image_info)
+    
+    async def run_all(self):
+        """Run dependent scenarios in order, then independent reads concurrently"""
+        print("\n" + "="*80)
+        print(" SAMUDRA SAHAYAK API TEST SUITE (async)")
+        print("="*80)
+        print(f"Started at: {datetime.now().isoformat()}")
+        print(f"API Base URL: {API_BASE_URL}")
+        print("="*80)
+        
+        # Registration must come before anything that submits reports
+        sequential = [
+            ("Scenario 1: Register & Verify", self.scenario_1_register_and_verify),
+            ("Scenario 2: Report with Image", self.scenario_2_submit_report_with_image),
+            ("Scenario 4: Report with Media", self.scenario_4_submit_report_with_media_async),
+            ("Scenario 5: Multiple Images", self.scenario_5_submit_report_multiple_images),
+        ]
+        concurrent = [
+            ("Scenario 3: Fetch Reports", self.scenario_3_fetch_user_reports_async),
+            ("Scenario 6: Profile Operations", self.scenario_6_user_profile_operations_async),
+            ("Scenario 7: Activity Tracking", self.scenario_7_user_activity_tracking_async),
+            ("Scenario 8: Reports Endpoints", self.scenario_8_test_reports_endpoints_async),
+        ]
+        
+        results = []
+        try:
+            for name, func in sequential:
+                try:
+                    result = func()
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                    results.append((name, result))
+                except Exception as e:
+                    self.logger.log_error(name, str(e))
+                    results.append((name, False))
+            
+            if self._ensure_logged_in():
+                outcomes = await asyncio.gather(*(func() for _, func in concurrent), return_exceptions=True)
+                for (name, _), outcome in zip(concurrent, outcomes):
+                    if isinstance(outcome, Exception):
+                        self.logger.log_error(name, str(outcome))
+                        outcome = False
+                    results.append((name, outcome))
+            else:
+                results.extend((name, False) for name, _ in concurrent)
+        finally:
+            await self.client.aclose()
+            self.logger.flush()
+            self.state.flush()
+        
+        return self._print_summary(results)
+
+
 def main():
     """Main entry point"""
     print("\nSamudra Sahayak API Testing Script")
     print("Using Real Email: c9014028307@gmail.com")
     print("Testing Mode: Interactive - One scenario at a time\n")
     
-    tester = APITester()
+    tester = AsyncAPITester() if sys.argv[1:2] == ["async"] else APITester()
     
     if len(sys.argv) > 1:
         # Run specific scenario
@@ -1261,9 +1802,11 @@ def main():
         elif scenario == "8":
             result = tester.scenario_8_test_reports_endpoints()
             print(f"\n{'✓ PASSED' if result else '✗ FAILED'}: Scenario 8")
+        elif scenario == "async":
+            result = asyncio.run(tester.run_all())
         else:
             print(f"Unknown scenario: {scenario}")
-            print("Usage: python test_api.py [1-8]")
+            print("Usage: python test_api.py [1-8|async]")
         sys.exit(0 if result else 1)
     else:
         # Interactive mode - run scenarios one by one with confirmation
@@ -1316,14 +1859,15 @@ def main():
                 tester.logger.log_error(name, str(e))
                 results.append((name, False))
                 print(f"\n✗ FAILED: {name} (Exception: {str(e)})")
+            finally:
+                tester.logger.flush()
+                tester.state.flush()
                 
                 # Ask if user wants to continue after error
                 if i < len(scenarios):
                     cont = input("\nContinue to next scenario? (y/n): ").strip().lower()
                     if cont != 'y':
                         break
-            
-            time.sleep(1)
         
         # Print final summary
         print("\n" + "="*80)
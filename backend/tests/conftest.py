@@ -0,0 +1,117 @@
+"""
+Shared fixtures for the API test suite
+"""
+import json
+import pytest
+from pathlib import Path
+
+# Test data directory
+TEST_DATA_DIR = Path(__file__).parent.parent / "test_data"
+
+
+def load_test_data(filename):
+    """Load test data from JSON file"""
+    return json.loads((TEST_DATA_DIR / filename).read_text())
+
+
+@pytest.fixture(scope="session")
+def auth_data():
+    """Auth payloads, parsed once per run"""
+    return load_test_data('auth_test_data.json')
+
+
+@pytest.fixture(scope="session")
+def reports_data():
+    """Report payloads and query parameters, parsed once per run"""
+    return load_test_data('reports_test_data.json')
+
+
+@pytest.fixture(scope="session")
+def alerts_data():
+    """Alert payloads and query parameters, parsed once per run"""
+    return load_test_data('alerts_test_data.json')
+
+
+@pytest.fixture(scope="session")
+def client():
+    """In-process client: requests go straight through the ASGI app, no server or sockets"""
+    from fastapi.testclient import TestClient
+    from main import app
+    with TestClient(app, headers={"User-Agent": "tests"}) as c:
+        yield c
+
+
+# Token accounts, seeded straight into the DB as verified users (register would leave them
+# unverified and send a verification email per run)
+TEST_USERS = {
+    "citizen": {
+        "fullName": "Test Citizen",
+        "email": "fixture-citizen@tests.invalid",
+        "role": "citizen",
+        "isOfficialVerified": False,
+    },
+    "official": {
+        "fullName": "Test Official",
+        "email": "fixture-official@tests.invalid",
+        "role": "official",
+        "isOfficialVerified": True,
+        "officialId": "TEST-OFFICIAL",
+        "organization": "Test Organization",
+    },
+}
+
+
+async def _seed_user(account):
+    """Upsert a verified account by email; safe to run from every xdist worker"""
+    from datetime import datetime
+    from pymongo.errors import DuplicateKeyError
+    from app.database import get_database
+
+    users = get_database().users
+    try:
+        await users.update_one(
+            {"email": account["email"]},
+            {
+                "$set": {**account, "isVerified": True, "updatedAt": datetime.utcnow()},
+                "$setOnInsert": {
+                    "language": "en",
+                    "loginAttempts": 0,
+                    "refreshTokens": [],
+                    "createdAt": datetime.utcnow(),
+                },
+            },
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # Another worker inserted the same account between our match and insert
+        pass
+    return await users.find_one({"email": account["email"]})
+
+
+@pytest.fixture(scope="session")
+def test_users(client):
+    """Seeded citizen and official user documents, keyed by role"""
+    return {role: client.portal.call(_seed_user, account) for role, account in TEST_USERS.items()}
+
+
+@pytest.fixture(scope="session")
+def auth_token(test_users):
+    """Citizen access token, minted once per run"""
+    from app.utils.auth import generate_tokens
+    return generate_tokens(test_users['citizen'])['accessToken']
+
+
+@pytest.fixture(scope="session")
+def official_token(test_users):
+    """Official access token, minted once per run"""
+    from app.utils.auth import generate_tokens
+    return generate_tokens(test_users['official'])['accessToken']
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep DB-mutating tests on a single xdist worker so they don't race each other
+    (tryfirst: xdist reads xdist_group marks in its own modifyitems hook)"""
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
@@ -3,66 +3,59 @@ Comprehensive API Tests for Samudra Sahayak Backend
 Run with: pytest tests/test_api.py -v
 """
 import pytest
-import json
 import os
-from pathlib import Path
 
-# Test data directory
-TEST_DATA_DIR = Path(__file__).parent.parent / "test_data"
-
-
-def load_test_data(filename):
-    """Load test data from JSON file"""
-    with open(TEST_DATA_DIR / filename, 'r') as f:
-        return json.load(f)
+# Accepted status codes
+OK = (200, 201)
+OK_OR_UNVERIFIED = (200, 403)
+OK_OR_FORBIDDEN = (200, 201, 403)
+OK_OR_AUTH = (200, 401)
+OK_OR_AUTH_OR_ERROR = (200, 401, 500)
+OK_OR_ERROR = (200, 500)
 
 
 class TestAuthEndpoints:
     """Test authentication endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Load test data"""
-        self.test_data = load_test_data('auth_test_data.json')
-        self.base_url = "http://localhost:8000/api/auth"
+    base_url = "/api/auth"
     
-    def test_register_citizen(self, client):
+    def test_register_citizen(self, client, auth_data):
         """Test citizen registration"""
         response = client.post(
             f"{self.base_url}/register",
-            json=self.test_data['register']['citizen']
+            json=auth_data['register']['citizen']
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in OK
         data = response.json()
         assert 'user' in data
         assert data['user']['role'] == 'citizen'
     
-    def test_register_official(self, client):
+    def test_register_official(self, client, auth_data):
         """Test official registration"""
         response = client.post(
             f"{self.base_url}/register",
-            json=self.test_data['register']['official']
+            json=auth_data['register']['official']
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in OK
         data = response.json()
         assert 'user' in data
         assert data['user']['role'] == 'official'
     
-    def test_login_with_email(self, client):
+    def test_login_with_email(self, client, auth_data):
         """Test login with email"""
         response = client.post(
             f"{self.base_url}/login",
-            json=self.test_data['login']['with_email']
+            json=auth_data['login']['with_email']
         )
-        assert response.status_code in [200, 403]  # 403 if not verified
+        assert response.status_code in OK_OR_UNVERIFIED  # 403 if not verified
         
-    def test_login_with_phone(self, client):
+    def test_login_with_phone(self, client, auth_data):
         """Test login with phone"""
         response = client.post(
             f"{self.base_url}/login",
-            json=self.test_data['login']['with_phone']
+            json=auth_data['login']['with_phone']
         )
-        assert response.status_code in [200, 403]
+        assert response.status_code in OK_OR_UNVERIFIED
     
     def test_guest_login(self, client):
         """Test guest session creation"""
@@ -72,21 +65,21 @@ class TestAuthEndpoints:
         assert 'token' in data
         assert data['token'].startswith('guest_')
     
-    def test_forgot_password_email(self, client):
+    def test_forgot_password_email(self, client, auth_data):
         """Test forgot password with email"""
         response = client.post(
             f"{self.base_url}/forgot-password",
-            json=self.test_data['forgot_password']['email']
+            json=auth_data['forgot_password']['email']
         )
         assert response.status_code == 200
         data = response.json()
         assert 'message' in data
     
-    def test_forgot_password_phone(self, client):
+    def test_forgot_password_phone(self, client, auth_data):
         """Test forgot password with phone"""
         response = client.post(
             f"{self.base_url}/forgot-password",
-            json=self.test_data['forgot_password']['phone']
+            json=auth_data['forgot_password']['phone']
         )
         assert response.status_code == 200
 
@@ -94,53 +87,28 @@ class TestAuthEndpoints:
 class TestReportEndpoints:
     """Test report endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Load test data"""
-        self.test_data = load_test_data('reports_test_data.json')
-        self.base_url = "http://localhost:8000/api/reports"
-    
-    def test_create_flood_report(self, client, auth_token):
-        """Test creating flood report"""
-        response = client.post(
-            self.base_url,
-            json=self.test_data['create_report']['flood'],
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        assert response.status_code in [200, 201]
-        data = response.json()
-        assert 'report' in data
-        assert data['report']['hazardType'] == 'flood'
-    
-    def test_create_fire_report(self, client, auth_token):
-        """Test creating fire report"""
-        response = client.post(
-            self.base_url,
-            json=self.test_data['create_report']['fire'],
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        assert response.status_code in [200, 201]
-        data = response.json()
-        assert data['report']['hazardType'] == 'fire'
-        assert data['report']['severity'] == 'critical'
-    
-    def test_create_marine_emergency_report(self, client, auth_token):
-        """Test creating marine emergency report"""
-        response = client.post(
-            self.base_url,
-            json=self.test_data['create_report']['marine_emergency'],
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        assert response.status_code in [200, 201]
-    
-    def test_create_pollution_report(self, client, auth_token):
-        """Test creating pollution report"""
+    base_url = "/api/reports"
+    
+    @pytest.mark.serial
+    @pytest.mark.parametrize("payload,hazard_type,severity", [
+        ("flood", "flood", None),
+        ("fire", "fire", "critical"),
+        ("marine_emergency", None, None),
+        ("pollution", None, None),
+    ])
+    def test_create_report(self, client, auth_token, reports_data, payload, hazard_type, severity):
+        """Test creating a report for each hazard payload"""
         response = client.post(
             self.base_url,
-            json=self.test_data['create_report']['pollution'],
+            json=reports_data['create_report'][payload],
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in OK
+        report = response.json()['report']
+        if hazard_type:
+            assert report['hazardType'] == hazard_type
+        if severity:
+            assert report['severity'] == severity
     
     def test_get_reports_no_filter(self, client):
         """Test getting all reports without filters"""
@@ -150,23 +118,23 @@ class TestReportEndpoints:
         assert 'reports' in data
         assert 'pagination' in data
     
-    def test_get_reports_by_severity(self, client):
+    def test_get_reports_by_severity(self, client, reports_data):
         """Test getting reports filtered by severity"""
-        params = self.test_data['query_parameters']['filter_by_severity']
+        params = reports_data['query_parameters']['filter_by_severity']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
         data = response.json()
         assert 'reports' in data
     
-    def test_get_reports_by_hazard_type(self, client):
+    def test_get_reports_by_hazard_type(self, client, reports_data):
         """Test getting reports filtered by hazard type"""
-        params = self.test_data['query_parameters']['filter_by_hazard_type']
+        params = reports_data['query_parameters']['filter_by_hazard_type']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
     
-    def test_get_reports_geospatial(self, client):
+    def test_get_reports_geospatial(self, client, reports_data):
         """Test geospatial query for reports"""
-        params = self.test_data['query_parameters']['geospatial_query']
+        params = reports_data['query_parameters']['geospatial_query']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
         data = response.json()
@@ -175,63 +143,44 @@ class TestReportEndpoints:
     def test_get_single_report(self, client, sample_report_id):
         """Test getting a single report"""
         response = client.get(f"{self.base_url}/{sample_report_id}")
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
+        assert response.json()['id'] == sample_report_id
 
 
 class TestAlertEndpoints:
     """Test alert endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Load test data"""
-        self.test_data = load_test_data('alerts_test_data.json')
-        self.base_url = "http://localhost:8000/api/alerts"
-    
-    def test_create_cyclone_warning(self, client, official_token):
-        """Test creating cyclone warning"""
-        response = client.post(
-            self.base_url,
-            json=self.test_data['create_alert']['cyclone_warning'],
-            headers={"Authorization": f"Bearer {official_token}"}
-        )
-        assert response.status_code in [200, 201, 403]  # 403 if not official
-    
-    def test_create_flood_advisory(self, client, official_token):
-        """Test creating flood advisory"""
-        response = client.post(
-            self.base_url,
-            json=self.test_data['create_alert']['flood_advisory'],
-            headers={"Authorization": f"Bearer {official_token}"}
-        )
-        assert response.status_code in [200, 201, 403]
+    base_url = "/api/alerts"
     
-    def test_create_marine_warning(self, client, official_token):
-        """Test creating marine warning"""
+    @pytest.mark.serial
+    @pytest.mark.parametrize("payload", ["cyclone_warning", "flood_advisory", "marine_emergency"])
+    def test_create_alert(self, client, official_token, alerts_data, payload):
+        """Test creating each alert payload"""
         response = client.post(
             self.base_url,
-            json=self.test_data['create_alert']['marine_emergency'],
+            json=alerts_data['create_alert'][payload],
             headers={"Authorization": f"Bearer {official_token}"}
         )
-        assert response.status_code in [200, 201, 403]
+        assert response.status_code in OK_OR_FORBIDDEN  # 403 if not official
     
-    def test_get_active_alerts(self, client):
+    def test_get_active_alerts(self, client, alerts_data):
         """Test getting active alerts"""
-        params = self.test_data['query_parameters']['active_alerts']
+        params = alerts_data['query_parameters']['active_alerts']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
         data = response.json()
         assert 'alerts' in data
         assert 'pagination' in data
     
-    def test_get_alerts_by_severity(self, client):
+    def test_get_alerts_by_severity(self, client, alerts_data):
         """Test getting alerts by severity"""
-        params = self.test_data['query_parameters']['by_severity']
+        params = alerts_data['query_parameters']['by_severity']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
     
-    def test_get_alerts_geospatial(self, client):
+    def test_get_alerts_geospatial(self, client, alerts_data):
         """Test geospatial query for alerts"""
-        params = self.test_data['query_parameters']['geospatial']
+        params = alerts_data['query_parameters']['geospatial']
         response = client.get(self.base_url, params=params)
         assert response.status_code == 200
 
@@ -239,13 +188,15 @@ class TestAlertEndpoints:
 class TestUserEndpoints:
     """Test user profile and settings endpoints"""
     
+    base_url = "/api/user"
+    
     def test_get_profile(self, client, auth_token):
         """Test getting user profile"""
         response = client.get(
-            "http://localhost:8000/api/user/profile",
+            f"{self.base_url}/profile",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 401]
+        assert response.status_code in OK_OR_AUTH
     
     def test_update_profile(self, client, auth_token):
         """Test updating user profile"""
@@ -254,32 +205,34 @@ class TestUserEndpoints:
             "language": "en"
         }
         response = client.put(
-            "http://localhost:8000/api/user/profile",
+            f"{self.base_url}/profile",
             json=update_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 401]
+        assert response.status_code in OK_OR_AUTH
     
     def test_get_settings(self, client, auth_token):
         """Test getting user settings"""
         response = client.get(
-            "http://localhost:8000/api/user/settings",
+            f"{self.base_url}/settings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 401]
+        assert response.status_code in OK_OR_AUTH
     
     def test_get_user_reports(self, client, auth_token):
         """Test getting user's reports"""
         response = client.get(
-            "http://localhost:8000/api/user/reports",
+            f"{self.base_url}/reports",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 401]
+        assert response.status_code in OK_OR_AUTH
 
 
 class TestUploadEndpoints:
     """Test upload and storage endpoints"""
     
+    base_url = "/api/upload"
+    
     def test_get_signed_upload_url(self, client, auth_token):
         """Test getting signed upload URL"""
         request_data = {
@@ -287,11 +240,11 @@ class TestUploadEndpoints:
             "contentType": "image/jpeg"
         }
         response = client.post(
-            "http://localhost:8000/api/upload/signed-url",
+            f"{self.base_url}/signed-url",
             json=request_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert response.status_code in [200, 401, 500]
+        assert response.status_code in OK_OR_AUTH_OR_ERROR
     
     def test_refresh_urls(self, client):
         """Test refreshing download URLs"""
@@ -299,15 +252,17 @@ class TestUploadEndpoints:
             "fileNames": ["test-file1.jpg", "test-file2.jpg"]
         }
         response = client.post(
-            "http://localhost:8000/api/upload/refresh-urls",
+            f"{self.base_url}/refresh-urls",
             json=request_data
         )
-        assert response.status_code in [200, 500]
+        assert response.status_code in OK_OR_ERROR
 
 
 class TestMapEndpoints:
     """Test map data endpoints"""
     
+    base_url = "/api/map"
+    
     def test_get_map_data(self, client):
         """Test getting map data"""
         params = {
@@ -316,7 +271,7 @@ class TestMapEndpoints:
             "radius": 50000
         }
         response = client.get(
-            "http://localhost:8000/api/map/data",
+            f"{self.base_url}/data",
             params=params
         )
         assert response.status_code == 200
@@ -326,7 +281,7 @@ class TestMapEndpoints:
     
     def test_get_initial_map_data(self, client):
         """Test getting initial map data"""
-        response = client.get("http://localhost:8000/api/map/initial-data")
+        response = client.get(f"{self.base_url}/initial-data")
         assert response.status_code == 200
         data = response.json()
         assert 'reports' in data
@@ -338,14 +293,14 @@ class TestHealthEndpoints:
     
     def test_health_check(self, client):
         """Test health check endpoint"""
-        response = client.get("http://localhost:8000/health")
+        response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data['status'] == 'healthy'
     
     def test_root_endpoint(self, client):
         """Test root endpoint"""
-        response = client.get("http://localhost:8000/")
+        response = client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert 'message' in data
@@ -353,31 +308,16 @@ class TestHealthEndpoints:
 
 
 # Pytest fixtures
-@pytest.fixture
-def client():
-    """Create a test client (requires httpx or requests)"""
-    import requests
-    return requests
-
-
-@pytest.fixture
-def auth_token(client):
-    """Get authentication token for testing"""
-    # This should be implemented to get a real token
-    # For now, return a placeholder
-    return "test-token"
-
-
-@pytest.fixture
-def official_token(client):
-    """Get official authentication token"""
-    return "official-test-token"
-
-
-@pytest.fixture
-def sample_report_id():
-    """Return a sample report ID for testing"""
-    return "507f1f77bcf86cd799439011"
+@pytest.fixture(scope="session")
+def sample_report_id(client, auth_token, reports_data):
+    """Create one report per run and return its ID"""
+    response = client.post(
+        "/api/reports",
+        json=reports_data['create_report']['flood'],
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code in OK, response.text
+    return response.json()['report']['id']
 
 
 if __name__ == "__main__":
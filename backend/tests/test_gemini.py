@@ -0,0 +1,86 @@
+"""
+Unit tests for the Gemini voice-report helpers (no network)
+Run with: pytest tests/test_gemini.py -v
+"""
+import base64
+import json
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import GeminiReportExtraction
+from app.utils.gemini import _AUDIO_PLACEHOLDER, _encode_request, _parse_extraction, sniff_audio_mime
+
+
+class TestSniffAudioMime:
+    """Test audio format detection from magic bytes"""
+    
+    @pytest.mark.parametrize("header,expected", [
+        (b"ID3\x04\x00", "audio/mpeg"),
+        (b"\xff\xfb\x90\x00", "audio/mpeg"),
+        (b"\xff\xf1\x50\x80", "audio/aac"),
+        (b"OggS\x00\x02", "audio/ogg"),
+        (b"fLaC\x00\x00", "audio/flac"),
+        (b"\x1a\x45\xdf\xa3\x01", "audio/webm"),
+        (b"RIFF\x24\x08\x00\x00WAVEfmt ", "audio/wav"),
+        (b"\x00\x00\x00\x20ftypM4A ", "audio/mp4"),
+    ])
+    def test_known_formats(self, header, expected):
+        assert sniff_audio_mime(header) == expected
+    
+    @pytest.mark.parametrize("header", [b"", b"\xff\xd8\xff\xe0JFIF", b"%PDF-1.7", b"RIFF\x00\x00\x00\x00AVI "])
+    def test_non_audio(self, header):
+        assert sniff_audio_mime(header) is None
+
+
+class TestEncodeRequest:
+    """_encode_request must produce the same JSON json.dumps would"""
+    
+    def test_without_audio(self):
+        contents = [{"role": "user", "parts": [{"text": "hello \"world\""}]}]
+        assert json.loads(_encode_request(contents, None)) == {"contents": contents}
+    
+    def test_splices_audio(self):
+        audio = base64.b64encode(b"\x00\x01binary audio\xff" * 100)
+        contents = [{"role": "user", "parts": [
+            {"text": "prompt"},
+            {"inline_data": {"mime_type": "audio/mpeg", "data": _AUDIO_PLACEHOLDER}},
+        ]}]
+        body = json.loads(_encode_request(contents, audio))
+        assert body["contents"][0]["parts"][1]["inline_data"]["data"] == audio.decode()
+        assert body["contents"][0]["parts"][0] == {"text": "prompt"}
+
+
+class TestGeminiReportExtraction:
+    """Test validation and normalisation of Gemini output"""
+    
+    def test_nulls_become_defaults(self):
+        data = GeminiReportExtraction.model_validate(
+            {"title": None, "hazardType": None, "severity": None, "tags": None, "peopleAtRisk": None}
+        )
+        assert data.title == "Voice Report"
+        assert data.hazardType == "other"
+        assert data.severity == "medium"
+        assert data.tags == []
+        assert data.peopleAtRisk is False
+    
+    def test_truncates_long_fields(self):
+        data = GeminiReportExtraction.model_validate(
+            {"title": "t" * 300, "description": "d" * 3000, "tags": [str(i) for i in range(20)]}
+        )
+        assert len(data.title) == 200
+        assert len(data.description) == 2000
+        assert len(data.tags) == 10
+    
+    def test_rejects_unknown_hazard(self):
+        with pytest.raises(ValidationError):
+            GeminiReportExtraction.model_validate({"hazardType": "volcano"})
+    
+    def test_parse_extraction_strips_fences(self):
+        text = '```json\n{"title": "Fire at the harbour", "hazardType": "fire", "severity": "critical"}\n```'
+        result = _parse_extraction(text)
+        assert result["title"] == "Fire at the harbour"
+        assert result["severity"] == "critical"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+PUT endpoint checks for user profile and settings (formerly the ad-hoc debug scripts)
+Run with: pytest tests/test_put_endpoints.py -v
+"""
+import pytest
+import json
+import random
+
+# Fresh number each run: users.phone is unique, so a fixed one collides with whichever
+# account already holds it
+TEST_PHONE = f"+919{random.randrange(10**9):09d}"
+
+PROFILE_BODIES = [
+    {'fullName': 'Updated Name Test', 'phone': TEST_PHONE, 'language': 'en', 'profession': 'Software Engineer'},
+    {'fullName': 'Test User Updated', 'language': 'hi'},
+    {'fullName': 'Direct Test User', 'language': 'te'},
+]
+
+SETTINGS_BODIES = [
+    {'notificationPreferences': {'email': True, 'sms': False, 'push': True}, 'language': 'te'},
+    {'notificationPreferences': {'email': True, 'sms': False, 'push': True}, 'language': 'en'},
+]
+
+
+@pytest.mark.serial
+class TestProfileUpdate:
+    """Test PUT /user/profile"""
+    
+    @pytest.mark.parametrize("body", PROFILE_BODIES)
+    def test_update_profile(self, client, auth_headers, body):
+        """Test profile update with json body"""
+        response = client.put("/api/user/profile", headers=auth_headers, json=body)
+        assert response.status_code == 200
+    
+    @pytest.mark.parametrize("encoding", ["json", "content", "no_content_type"])
+    def test_update_profile_encodings(self, client, auth_token, encoding):
+        """Test the same profile body sent as json=, pre-serialized content=, and without explicit Content-Type"""
+        body = PROFILE_BODIES[0]
+        headers = {'Authorization': f'Bearer {auth_token}'}
+        if encoding == "json":
+            headers['Content-Type'] = 'application/json'
+            response = client.put("/api/user/profile", headers=headers, json=body)
+        elif encoding == "content":
+            headers['Content-Type'] = 'application/json'
+            response = client.put("/api/user/profile", headers=headers, content=json.dumps(body))
+        else:
+            response = client.put("/api/user/profile", headers=headers, json=body)
+        assert response.status_code == 200
+
+
+@pytest.mark.serial
+class TestSettingsUpdate:
+    """Test PUT /user/settings"""
+    
+    @pytest.mark.parametrize("body", SETTINGS_BODIES)
+    def test_update_settings(self, client, auth_headers, body):
+        """Test settings update"""
+        response = client.put("/api/user/settings", headers=auth_headers, json=body)
+        assert response.status_code == 200
+
+
+# Pytest fixtures
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Authorization + JSON content type headers"""
+    return {'Authorization': f'Bearer {auth_token}', 'Content-Type': 'application/json'}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
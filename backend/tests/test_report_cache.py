@@ -0,0 +1,97 @@
+"""
+Unit tests for the near-duplicate voice report cache
+Run with: pytest tests/test_report_cache.py -v
+"""
+import asyncio
+import pytest
+
+from app.utils import report_cache
+from app.utils.report_cache import SemanticReportCache, cosine_similarity, haversine_meters
+
+# Marine Drive, Mumbai
+LNG, LAT = 72.8236, 18.9438
+RESULT = {"title": "Flooding near Marine Drive", "hazardType": "flood"}
+
+
+class TestHelpers:
+    """Test the vector and distance helpers"""
+    
+    def test_cosine_similarity(self):
+        assert cosine_similarity([1.0, 0.0], [1.0, 0.0]) == pytest.approx(1.0)
+        assert cosine_similarity([1.0, 0.0], [0.0, 1.0]) == pytest.approx(0.0)
+        assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+    
+    def test_haversine_meters(self):
+        assert haversine_meters(LNG, LAT, LNG, LAT) == 0
+        # 0.01 degrees of latitude is about 1.1 km
+        assert haversine_meters(LNG, LAT, LNG, LAT + 0.01) == pytest.approx(1113, rel=0.01)
+
+
+class TestSemanticReportCache:
+    """Test matching, distance, threshold and TTL behaviour"""
+    
+    def test_returns_copy_of_match(self, cache):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        hit = cache.lookup([1.0, 0.01, 0.0], LNG, LAT)
+        assert hit == RESULT
+        hit["title"] = "changed"
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT) == RESULT
+    
+    def test_below_similarity_threshold_misses(self, cache):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        # cos = 0.8 < SIMILARITY_THRESHOLD
+        assert cache.lookup([0.8, 0.6, 0.0], LNG, LAT) is None
+    
+    def test_beyond_max_distance_misses(self, cache):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT + 0.001) == RESULT  # ~110 m
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT + 0.01) is None  # ~1.1 km
+    
+    def test_best_match_wins(self, cache):
+        cache.add([1.0, 0.3, 0.0], {"title": "close"}, LNG, LAT)
+        cache.add([1.0, 0.05, 0.0], {"title": "closest"}, LNG, LAT)
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT) == {"title": "closest"}
+    
+    def test_zero_query_vector_misses(self, cache):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        assert cache.lookup([0.0, 0.0, 0.0], LNG, LAT) is None
+    
+    def test_expired_entries_are_evicted(self, cache, clock):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        clock[0] += 60
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT) == RESULT
+        clock[0] += 61
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT) is None
+        assert not cache._entries
+    
+    def test_max_entries_drops_oldest(self, clock):
+        cache = SemanticReportCache(max_entries=2, ttl=120)
+        cache.add([1.0, 0.0, 0.0], {"title": "first"}, LNG, LAT)
+        cache.add([0.0, 1.0, 0.0], {"title": "second"}, LNG, LAT)
+        cache.add([0.0, 0.0, 1.0], {"title": "third"}, LNG, LAT)
+        assert cache.lookup([1.0, 0.0, 0.0], LNG, LAT) is None
+        assert cache.lookup([0.0, 0.0, 1.0], LNG, LAT) == {"title": "third"}
+    
+    def test_lookup_async_matches_lookup(self, cache):
+        cache.add([1.0, 0.0, 0.0], RESULT, LNG, LAT)
+        assert asyncio.run(cache.lookup_async([1.0, 0.01, 0.0], LNG, LAT)) == RESULT
+        assert asyncio.run(cache.lookup_async([0.0, 1.0, 0.0], LNG, LAT)) is None
+
+
+# Pytest fixtures
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(report_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(clock):
+    """Empty cache with a 2 minute TTL"""
+    return SemanticReportCache(max_entries=8, ttl=120)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
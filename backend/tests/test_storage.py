@@ -0,0 +1,39 @@
+"""
+Unit tests for upload file classification
+Run with: pytest tests/test_storage.py -v
+"""
+import pytest
+
+from app.utils.storage import classify_file, get_content_type, validate_file_type
+
+
+class TestClassifyFile:
+    """Test extension validation and MIME lookup"""
+    
+    @pytest.mark.parametrize("filename,content_type", [
+        ("photo.jpg", "image/jpeg"),
+        ("PHOTO.JPG", "image/jpeg"),
+        ("voice.note.mp3", "audio/mpeg"),
+        ("clip.mp4", "video/mp4"),
+        ("doc.pdf", "application/pdf"),
+    ])
+    def test_allowed(self, filename, content_type):
+        assert classify_file(filename) == (True, content_type, None)
+    
+    @pytest.mark.parametrize("filename", ["", "noextension", None])
+    def test_invalid_filename(self, filename):
+        assert classify_file(filename) == (False, None, "Invalid filename")
+    
+    def test_disallowed_extension(self):
+        assert classify_file("script.exe") == (False, None, "File type .exe is not allowed")
+    
+    def test_wrappers_agree(self):
+        for filename in ("photo.jpg", "script.exe", "noextension"):
+            is_valid, content_type, error = classify_file(filename)
+            assert validate_file_type(filename) == (is_valid, error)
+            if is_valid:
+                assert get_content_type(filename) == content_type
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,42 @@
+"""
+Unit tests for credential validation
+Run with: pytest tests/test_validation.py -v
+"""
+import pytest
+
+from app.utils.validation import validate_credential, validate_credentials_batch
+
+CREDENTIALS = [
+    "user@example.com",
+    "  Mixed.Case+tag@Example.co.in  ",
+    "+919876543210",
+    "98765 43210",
+    "(022) 2345-6789",
+    "+1 (555) 010-9999",
+    "0123456789",
+    "not-an-email",
+    "user@localhost",
+    "",
+    "   ",
+    "+",
+    "12",
+    "1" * 16,
+]
+
+
+class TestValidateCredentialsBatch:
+    """Batch validation must agree with validate_credential one-by-one"""
+    
+    @pytest.mark.parametrize("credential", CREDENTIALS)
+    def test_matches_single(self, credential):
+        assert validate_credentials_batch([credential]) == [validate_credential(credential)]
+    
+    def test_preserves_order(self):
+        assert validate_credentials_batch(CREDENTIALS) == [validate_credential(c) for c in CREDENTIALS]
+    
+    def test_empty(self):
+        assert validate_credentials_batch([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,55 @@
+"""
+Access token cache shared by the local API test scripts
+Tokens are kept in ~/.cache/sih2025/token.json and reused until shortly before they expire
+"""
+import base64
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "sih2025" / "token.json"
+EXPIRY_MARGIN_SECONDS = 60
+
+
+def token_exp(token: str) -> Optional[float]:
+    """Read the exp claim from a JWT payload (no signature check)"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def token_is_fresh(token: Optional[str]) -> bool:
+    """True if the token is valid for at least EXPIRY_MARGIN_SECONDS more"""
+    exp = token_exp(token) if token else None
+    return exp is not None and exp - time.time() > EXPIRY_MARGIN_SECONDS
+
+
+def load_cached_token(credential: str) -> Optional[str]:
+    """Return the cached token for this credential if it is still fresh"""
+    try:
+        cached = json.loads(TOKEN_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("credential") != credential:
+        return None
+    token = cached.get("access_token")
+    return token if token_is_fresh(token) else None
+
+
+def save_token(credential: str, token: str):
+    """Cache a freshly issued token together with its expiry (owner-only, written atomically)"""
+    TOKEN_CACHE_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = TOKEN_CACHE_FILE.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({
+            "credential": credential,
+            "access_token": token,
+            "exp": token_exp(token)
+        }, f)
+    os.replace(tmp_path, TOKEN_CACHE_FILE)
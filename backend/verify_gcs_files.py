@@ -19,24 +19,30 @@ def list_bucket_files():
         print(f"Files in GCS Bucket: {settings.GOOGLE_CLOUD_BUCKET_NAME}")
         print(f"{'='*80}\n")
         
-        blobs = list(bucket.list_blobs())
+        # Stream pages, fetching only the fields printed below
+        blobs = client.list_blobs(
+            bucket,
+            fields="items(name,size,timeCreated,contentType),nextPageToken",
+            page_size=1000
+        )
+        public_prefix = f"https://storage.googleapis.com/{settings.GOOGLE_CLOUD_BUCKET_NAME}/"
         
-        if not blobs:
+        count = 0
+        for count, blob in enumerate(blobs, 1):
+            sys.stdout.write(
+                f"{count}. {blob.name}\n"
+                f"   Size: {blob.size:,} bytes\n"
+                f"   Created: {blob.time_created}\n"
+                f"   Content-Type: {blob.content_type}\n"
+                f"   Public URL: {public_prefix}{blob.name}\n\n"
+            )
+        
+        if not count:
             print("No files found in bucket.")
             return
         
-        print(f"Total files: {len(blobs)}\n")
-        
-        for i, blob in enumerate(blobs, 1):
-            print(f"{i}. {blob.name}")
-            print(f"   Size: {blob.size:,} bytes")
-            print(f"   Created: {blob.time_created}")
-            print(f"   Content-Type: {blob.content_type}")
-            print(f"   Public URL: https://storage.googleapis.com/{settings.GOOGLE_CLOUD_BUCKET_NAME}/{blob.name}")
-            print()
-        
         print(f"{'='*80}")
-        print(f"✓ Successfully verified {len(blobs)} files in GCS")
+        print(f"✓ Successfully verified {count} files in GCS")
         print(f"{'='*80}\n")
         
     except Exception as e:
@@ -3,27 +3,41 @@ Simple GCS file verification without app dependencies
 """
 from google.cloud import storage
 from google.oauth2 import service_account
+from dotenv import dotenv_values
 import json
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+ENV_PATH = Path(".env")
+
+
+@lru_cache(maxsize=1)
+def _env() -> dict:
+    """Parse .env once per process (quoted values keep any inner quotes and '=' intact)"""
+    return dotenv_values(ENV_PATH)
+
+
+@lru_cache(maxsize=1)
+def _client() -> storage.Client:
+    """Build the GCS client once (loading the service-account key is the expensive part)"""
+    env_vars = _env()
+    credentials = service_account.Credentials.from_service_account_info(
+        json.loads(env_vars['GOOGLE_CLOUD_KEYFILE'])
+    )
+    return storage.Client(credentials=credentials, project=env_vars['GOOGLE_CLOUD_PROJECT_ID'])
+
+
 def list_bucket_files():
     """List all files in the GCS bucket"""
     try:
         # Load credentials from .env
-        env_path = Path(".env")
-        if not env_path.exists():
-            print(f"❌ .env file not found at {env_path}")
+        if not ENV_PATH.exists():
+            print(f"❌ .env file not found at {ENV_PATH}")
             return
         
-        # Read .env file
-        env_vars = {}
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip().strip('"').strip("'")
+        env_vars = _env()
         
         # Get GCS config
         bucket_name = env_vars.get('GOOGLE_CLOUD_BUCKET_NAME', 'sih-media-reeiver')
@@ -38,40 +52,42 @@ def list_bucket_files():
         
         # Parse credentials JSON
         try:
-            creds_dict = json.loads(keyfile_json)
+            client = _client()
         except json.JSONDecodeError as e:
             print(f"❌ Invalid JSON in GOOGLE_CLOUD_KEYFILE: {e}")
             return
         
-        credentials = service_account.Credentials.from_service_account_info(creds_dict)
-        client = storage.Client(credentials=credentials, project=project_id)
-        
         print(f"\n{'='*80}")
         print(f"Files in GCS Bucket: {bucket_name}")
         print(f"Project: {project_id}")
         print(f"{'='*80}\n")
         
         bucket = client.bucket(bucket_name)
-        blobs = list(bucket.list_blobs())
+        # Stream pages, fetching only the fields printed below
+        blobs = client.list_blobs(
+            bucket,
+            fields="items(name,size,timeCreated,contentType,md5Hash),nextPageToken",
+            page_size=1000
+        )
+        
+        count = 0
+        for count, blob in enumerate(blobs, 1):
+            sys.stdout.write(
+                f"{count}. {blob.name}\n"
+                f"   Size: {blob.size:,} bytes ({blob.size / 1024:.2f} KB)\n"
+                f"   Created: {blob.time_created}\n"
+                f"   Content-Type: {blob.content_type}\n"
+                f"   MD5: {blob.md5_hash}\n"
+                f"   Public URL: https://storage.googleapis.com/{bucket_name}/{blob.name}\n\n"
+            )
         
-        if not blobs:
+        if not count:
             print("❌ No files found in bucket.")
             print("   The uploads may have failed or files were deleted.")
             return
         
-        print(f"✓ Total files: {len(blobs)}\n")
-        
-        for i, blob in enumerate(blobs, 1):
-            print(f"{i}. {blob.name}")
-            print(f"   Size: {blob.size:,} bytes ({blob.size / 1024:.2f} KB)")
-            print(f"   Created: {blob.time_created}")
-            print(f"   Content-Type: {blob.content_type}")
-            print(f"   MD5: {blob.md5_hash}")
-            print(f"   Public URL: https://storage.googleapis.com/{bucket_name}/{blob.name}")
-            print()
-        
         print(f"{'='*80}")
-        print(f"✓ Successfully verified {len(blobs)} files in GCS bucket")
+        print(f"✓ Successfully verified {count} files in GCS bucket")
         print(f"{'='*80}\n")
         
     except Exception as e: